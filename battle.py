@@ -0,0 +1,185 @@
+"""
+Headless battle engine for monster fights.
+
+No input, printing or sleeping happens here: a fight is a BattleSetup (the
+fixed numbers for this player vs this monster) plus a BattleState that
+battle_step turns into the next state and a tuple of events. The interactive
+fight in rpg.random_encounter drives this engine and renders the events,
+simulators and balance checks call it directly.
+"""
+
+import randomness
+from dataclasses import dataclass
+from typing import Callable, NamedTuple, Tuple
+
+combat_rng = randomness.stream("combat")
+
+# ----------------------
+# Events
+# ----------------------
+# Each event is a (kind, amount) tuple, amount is 0 when it carries no number
+ESCAPED = "escaped"
+ESCAPE_FAILED = "escape_failed"
+PLAYER_HIT = "player_hit"
+PLAYER_MISS = "player_miss"
+COUNTER_HIT = "counter_hit"
+COUNTER_FAILED = "counter_failed"
+MONSTER_PREPARES = "monster_prepares"
+MONSTER_HIT = "monster_hit"
+MONSTER_MISS = "monster_miss"
+ITEM_SAFE = "item_safe"
+
+ACTIONS = ("run", "attack", "counter", "use item")
+
+# Outcomes
+ONGOING = ""
+WON = "won"
+LOST = "lost"
+FLED = "fled"
+
+# ----------------------
+# Data structures
+# ----------------------
+@dataclass(frozen=True)
+class BattleSetup:
+    """Everything that stays fixed for one player vs one monster.
+
+    All the hit/miss thresholds are worked out once here instead of on every turn.
+    """
+    monster_name: str
+    dmg_min: int            # player weapon roll, strength included
+    dmg_max: int
+    mdmg_min: int           # monster roll before defence
+    mdmg_max: int
+    mdmg_reduction: float   # 5 * defence
+    counter_min: int
+    counter_max: int
+    hit_chance: float       # attack / counter, 75 - 3*level + 5*accuracy
+    run_chance: float       # 75 - 3*level + 5*agility
+    run_strike: float       # monster hits a failed escape, 50 - 2*level + 5*agility
+    attack_strike: float    # monster hits back after an attack, 75 + 2*level - 5*agility
+    counter_strike: float   # monster hits a failed counter, 75 - 3*level + 5*agility
+    item_strike: float      # monster hits while using an item, 60 + 3*level - 5*agility
+
+# A NamedTuple rather than a frozen dataclass since one is built every turn
+# and tuples are several times cheaper to create
+class BattleState(NamedTuple):
+    player_hp: int
+    monster_hp: int
+    turn: int = 0
+    outcome: str = ONGOING
+
+def make_setup(level, weapon, skill_set, monster_name, monster_damage):
+    """Build a BattleSetup from the player's numbers and a monster's name and damage."""
+    strength = skill_set['strength']
+    agility = skill_set['agility']
+    accuracy = skill_set['accuracy']
+    return BattleSetup(
+        monster_name=monster_name,
+        dmg_min=weapon[1] + 5*strength,
+        dmg_max=weapon[2] + 5*strength,
+        mdmg_min=int(monster_damage*0.7),
+        mdmg_max=monster_damage,
+        mdmg_reduction=5*skill_set['defence'],
+        counter_min=min(weapon[2], monster_damage),
+        counter_max=round(max(weapon[2], monster_damage) * 1.5),
+        hit_chance=75 - 3*level + 5*accuracy,
+        run_chance=75 - 3*level + 5*agility,
+        run_strike=50 - 2*level + 5*agility,
+        attack_strike=75 + 2*level - 5*agility,
+        counter_strike=75 - 3*level + 5*agility,
+        item_strike=60 + 3*level - 5*agility,
+    )
+
+def setup_from_game(game, monster_name, monster_damage):
+    """BattleSetup for the game's equipped weapon and current skills."""
+    return make_setup(game['level'], game["weapons"][game["equipped"]], game['skill_set'], monster_name, monster_damage)
+
+# ----------------------
+# Engine
+# ----------------------
+def roll_damage(setup: BattleSetup, rng=combat_rng) -> Tuple[int, int]:
+    """The turn's (player damage, monster damage) rolls, made every turn whatever the action."""
+    randint = rng.randint
+    return randint(setup.dmg_min, setup.dmg_max), round(randint(setup.mdmg_min, setup.mdmg_max) - setup.mdmg_reduction)
+
+def battle_step(setup: BattleSetup, state: BattleState, action: str, rng=combat_rng, rolls=None) -> Tuple[BattleState, tuple]:
+    """Play one turn of `action` and return the new state and the events it produced.
+
+    Unknown actions still use up the turn's damage rolls but do nothing else,
+    the same as typing nonsense at the battle prompt. `rolls` is the turn's
+    roll_damage(), made here when not given. For "use item" the game rolls
+    before the item is used, so the monster hits with the defence from
+    before the item and `setup` (built after it) only decides whether it strikes.
+    """
+    player_hp = state.player_hp
+    monster_hp = state.monster_hp
+    randint = rng.randint
+
+    dmg, mdmg = rolls or roll_damage(setup, rng)
+
+    if action == "run":
+        if randint(0, 100) < setup.run_chance:
+            return BattleState(player_hp, monster_hp, state.turn + 1, FLED), ((ESCAPED, 0),)
+        events = [(ESCAPE_FAILED, 0)]
+        if monster_hp > 0:
+            if randint(0, 100) < setup.run_strike:
+                player_hp -= mdmg
+                events.append((MONSTER_HIT, mdmg))
+            else:
+                events.append((MONSTER_MISS, 0))
+    elif action == "attack":
+        if randint(0, 100) < setup.hit_chance:
+            monster_hp -= dmg
+            events = [(PLAYER_HIT, dmg)]
+        else:
+            events = [(PLAYER_MISS, 0)]
+        if monster_hp > 0:
+            if randint(0, 100) < setup.attack_strike:
+                player_hp -= mdmg
+                events.append((MONSTER_HIT, mdmg))
+            else:
+                events.append((MONSTER_MISS, 0))
+    elif action == "counter":
+        if randint(0, 100) <= setup.hit_chance:
+            dmg = randint(setup.counter_min, setup.counter_max)
+            monster_hp -= dmg
+            events = [(COUNTER_HIT, dmg)]
+        else:
+            events = [(COUNTER_FAILED, 0)]
+            if monster_hp > 0:
+                if randint(0, 100) < setup.counter_strike:
+                    player_hp -= mdmg
+                    events.append((MONSTER_HIT, mdmg))
+                else:
+                    events.append((MONSTER_MISS, 0))
+    elif action == "use item":
+        # The item itself is applied by the caller between roll_damage and this step
+        if randint(0, 100) <= setup.item_strike and monster_hp > 0:
+            player_hp -= mdmg
+            events = [(MONSTER_PREPARES, 0), (MONSTER_HIT, mdmg)]
+        else:
+            events = [(ITEM_SAFE, 0)]
+    else:
+        events = []
+
+    if monster_hp <= 0:
+        outcome = WON
+    elif player_hp <= 0:
+        outcome = LOST
+    else:
+        outcome = ONGOING
+    return BattleState(player_hp, monster_hp, state.turn + 1, outcome), tuple(events)
+
+def fight(setup: BattleSetup, state: BattleState, policy: Callable[[BattleSetup, BattleState], str], rng=combat_rng, max_turns=1000) -> BattleState:
+    """Run battle_step until the fight ends, asking `policy` for each action.
+
+    Returns the final state, whose outcome is ONGOING only if max_turns ran out.
+    """
+    while state.outcome == ONGOING and state.turn < max_turns:
+        state, _ = battle_step(setup, state, policy(setup, state), rng)
+    return state
+
+def always_attack(setup, state):
+    """Simplest policy, attacks every turn."""
+    return "attack"
@@ -6,9 +6,17 @@ from drago_animations import (
     animate_get_hit_by_sword,
     animate_hit
 )
-import os, sys, time, random as r
-from dataclasses import dataclass
-from typing import Dict, Tuple, Callable
+import os, sys, time, output, randomness
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple, Callable
+
+# Random streams this module draws from
+combat_rng = randomness.stream("combat")
+boss_rng = randomness.stream("boss_ai")
+animation_rng = randomness.stream("animation")
 
 # ----------------------
 # Data structures
@@ -24,7 +32,7 @@ class BossState:
     enraged: bool
     cooldowns: Dict[str, int] # {move_name: turns_remaining}
 
-@dataclass
+@dataclass(frozen=True)
 class BossMove:
     name: str
     priority: Callable[[BossState], float]
@@ -32,108 +40,195 @@ class BossMove:
     dmg_range: Tuple[int, int] = (0, 0)   # positive = damage, negative = heal
     requires_charge: bool = False
     heal_move: bool = False
+    hp_bands: Tuple[float, ...] = ()      # boss HP ratios the priority switches at (ratio <= band)
 
 # ----------------------
 # Generic Boss AI
 # ----------------------
-def boss_pick_action(state: BossState, moves: Dict[str, BossMove]) -> Tuple[BossMove, str]:
-    """Return the BossMove chosen and its flavor text."""
+# Move priorities may only look at the inputs a DecisionTable is keyed by:
+# the player's last action, is_charging, enraged and which side of each
+# hp_bands ratio the boss is on. They are evaluated once per combination
+# when the table is compiled, never during a fight.
+
+# Player actions priorities can tell apart, anything else is treated like ""
+KNOWN_ACTIONS = ("attack", "defend", "parry", "counter", "use item", "")
+
+# Played when no move scores above zero
+FALLBACK_MOVE = BossMove(
+    "basic_attack",
+    lambda s: 0,
+    "The boss lashes out desperately!",
+    dmg_range=(200, 400)
+)
+
+class DecisionTable:
+    """A boss's move set compiled into a flat lookup of candidate moves.
+
+    Each slot holds the moves boss_pick_action would choose between (top
+    score and everything within 80% of it, best first), keyed by last action,
+    charging, enraged, HP band and the mask of moves on cooldown.
+    """
+    def __init__(self, moves: Mapping[str, BossMove]):
+        self.moves = moves
+        self.forced = moves.get("flame_breath")
+        self.names = tuple(moves)
+        self.bands = tuple(sorted({b for m in moves.values() for b in m.hp_bands}))
+        self.actions = {a: i for i, a in enumerate(KNOWN_ACTIONS)}
+        self.no_action = self.actions[""]
+        # Key strides, the cooldown mask takes the low bits
+        self.band_stride = 1 << len(self.names)
+        self.enraged_stride = self.band_stride * (len(self.bands) + 1)
+        self.charging_stride = self.enraged_stride * 2
+        self.action_stride = self.charging_stride * 2
+        self.table = tuple(self._compile(*self._unpack(key)) for key in range(self.action_stride * len(KNOWN_ACTIONS)))
+
+    def _unpack(self, key):
+        key, mask = divmod(key, self.band_stride)
+        key, band = divmod(key, len(self.bands) + 1)
+        key, enraged = divmod(key, 2)
+        action, charging = divmod(key, 2)
+        return action, charging, enraged, band, mask
+
+    def _compile(self, action, charging, enraged, band, mask):
+        # Representative state for this slot, a ratio of exactly the band's upper edge
+        ratio = self.bands[band] if band < len(self.bands) else 1.0
+        state = BossState(0, ratio, 1, 0, KNOWN_ACTIONS[action], bool(charging), bool(enraged), {})
+
+        scored = []
+        for bit, move in enumerate(self.moves.values()):
+            if mask >> bit & 1:
+                continue
+            score = move.priority(state)
+            if score > 0:
+                scored.append((score, move))
+        if not scored:
+            return ()
+        scored.sort(key=lambda x: x[0], reverse=True)
+        top_score = scored[0][0]
+        return tuple(m for sc, m in scored if sc >= top_score * 0.8)
+
+    def candidates(self, state: BossState) -> Tuple[BossMove, ...]:
+        cooldowns = state.cooldowns
+        key = 0
+        bit = 1
+        for name in self.names:
+            if cooldowns.get(name, 0) > 0:
+                key |= bit
+            bit <<= 1
+        key += bisect_left(self.bands, state.boss_hp/state.boss_max_hp) * self.band_stride
+        if state.enraged:
+            key += self.enraged_stride
+        if state.is_charging:
+            key += self.charging_stride
+        key += self.actions.get(state.player_last_action, self.no_action) * self.action_stride
+        return self.table[key]
+
+# Compiled tables by the (name, move) pairs they were built from. BossMoves
+# are frozen and hashable, so a changed move set is a new key, never a stale
+# table, and only the most recent move sets are kept
+@lru_cache(maxsize=64)
+def _compile(items: Tuple[Tuple[str, BossMove], ...]) -> DecisionTable:
+    return DecisionTable(MappingProxyType(dict(items)))
+
+def decision_table(moves: Mapping[str, BossMove]) -> DecisionTable:
+    """The DecisionTable for `moves`, compiled on first use."""
+    return _compile(tuple(moves.items()))
+
+def boss_pick_action(state: BossState, moves, rng=boss_rng) -> Tuple[BossMove, str]:
+    """Return the BossMove chosen and its flavor text.
+
+    `moves` is a move dict or its DecisionTable.
+    """
+    table = moves if isinstance(moves, DecisionTable) else decision_table(moves)
 
     # forced flame_breath if charging
-    if state.is_charging and "flame_breath" in moves:
-        return (moves["flame_breath"], moves["flame_breath"].execute_note)
-
-    scored = []
-    for move_name, move in moves.items():
-        if state.cooldowns.get(move_name, 0) > 0:
-            continue
-        score = move.priority(state)
-        if score > 0:
-            scored.append((score, move))
-
-    if not scored:
-        # fallback basic attack
-        fallback = BossMove(
-            "basic_attack",
-            lambda s: 0,
-            "The boss lashes out desperately!",
-            dmg_range=(200, 400)
-        )
-        return (fallback, fallback.execute_note)
-
-    scored.sort(key=lambda x: x[0], reverse=True)
-    top_score = scored[0][0]
-    filtered = [m for sc, m in scored if sc >= top_score * 0.8]
-    chosen = r.choice(filtered)
+    if state.is_charging and table.forced is not None:
+        return (table.forced, table.forced.execute_note)
+
+    candidates = table.candidates(state)
+    if not candidates:
+        return (FALLBACK_MOVE, FALLBACK_MOVE.execute_note)
+
+    chosen = rng.choice(candidates)
     return (chosen, chosen.execute_note)
 
 # ----------------------
 # Boss Move Definitions
 # ----------------------
+DRAGO_MOVES = MappingProxyType({
+    "charge": BossMove(
+        "charge",
+        priority=lambda s: 0.3 + (0.1 if s.enraged else 0.0),
+        execute_note="Drago inhales—heat distorts the air...",
+        dmg_range=(0, 0)
+    ),
+    "flame_breath": BossMove(
+        "flame_breath",
+        priority=lambda s: 0,
+        execute_note="Drago unleashes the stored inferno!",
+        dmg_range=(500, 1000),
+        requires_charge=True
+    ),
+    "tail_swipe": BossMove(
+        "tail_swipe",
+        priority=lambda s: 0.7 if s.player_last_action == "defend" else 0.4,
+        execute_note="A sweeping tail aims to break your guard!",
+        dmg_range=(750, 1200)
+    ),
+    "wing_attack": BossMove(
+        "wing_attack",
+        priority=lambda s: 0.7 if s.player_last_action == "counter" else 0.4,
+        execute_note="Wings blur—multiple strikes to foil a counter!",
+        dmg_range=(900, 1300)
+    ),
+    "heal": BossMove(
+        "heal",
+        priority=lambda s: 0.8 if (s.boss_hp/s.boss_max_hp <= 0.33) else 0,
+        execute_note="Scales glow as wounds knit back together.",
+        dmg_range=(-500, 0),
+        heal_move=True,
+        hp_bands=(0.33,)
+    ),
+})
+
+SPIDEY_MOVES = MappingProxyType({
+    "web_shot": BossMove(
+        "web_shot",
+        priority=lambda s: 0.6 if s.player_last_action == "attack" else 0.4,
+        execute_note="Spidey shoots sticky webs to slow you!",
+        dmg_range=(400, 700)
+    ),
+    "fang_bite": BossMove(
+        "fang_bite",
+        priority=lambda s: 0.7 if s.player_last_action in ("defend", "parry") else 0.5,
+        execute_note="Spidey lunges with venomous fangs!",
+        dmg_range=(600, 1000)
+    ),
+    "leg_stab": BossMove(
+        "leg_stab",
+        priority=lambda s: 0.7 if s.player_last_action == "counter" else 0.5,
+        execute_note="Spidey jabs with razor legs!",
+        dmg_range=(500, 900)
+    ),
+    "cocoon": BossMove(
+        "cocoon",
+        priority=lambda s: 0.8 if (s.boss_hp/s.boss_max_hp <= 0.3) else 0,
+        execute_note="Spidey spins a cocoon to shield itself.",
+        dmg_range=(-400, 0),
+        heal_move=True,
+        hp_bands=(0.3,)
+    ),
+})
+
+# Move sets are built and compiled once at import and shared, read-only, by every fight
+for _moves in (DRAGO_MOVES, SPIDEY_MOVES):
+    decision_table(_moves)
+
 def get_drago_moves():
-    return {
-        "charge": BossMove(
-            "charge",
-            priority=lambda s: 0.3 + (0.1 if s.enraged else 0.0),
-            execute_note="Drago inhales—heat distorts the air...",
-            dmg_range=(0, 0)
-        ),
-        "flame_breath": BossMove(
-            "flame_breath",
-            priority=lambda s: 0,
-            execute_note="Drago unleashes the stored inferno!",
-            dmg_range=(500, 1000),
-            requires_charge=True
-        ),
-        "tail_swipe": BossMove(
-            "tail_swipe",
-            priority=lambda s: 0.7 if s.player_last_action == "defend" else 0.4,
-            execute_note="A sweeping tail aims to break your guard!",
-            dmg_range=(750, 1200)
-        ),
-        "wing_attack": BossMove(
-            "wing_attack",
-            priority=lambda s: 0.7 if s.player_last_action == "counter" else 0.4,
-            execute_note="Wings blur—multiple strikes to foil a counter!",
-            dmg_range=(900, 1300)
-        ),
-        "heal": BossMove(
-            "heal",
-            priority=lambda s: 0.8 if (s.boss_hp/s.boss_max_hp <= 0.33) else 0,
-            execute_note="Scales glow as wounds knit back together.",
-            dmg_range=(-500, 0),
-            heal_move=True
-        ),
-    }
+    return DRAGO_MOVES
 
 def get_spidey_moves():
-    return {
-        "web_shot": BossMove(
-            "web_shot",
-            priority=lambda s: 0.6 if s.player_last_action == "attack" else 0.4,
-            execute_note="Spidey shoots sticky webs to slow you!",
-            dmg_range=(400, 700)
-        ),
-        "fang_bite": BossMove(
-            "fang_bite",
-            priority=lambda s: 0.7 if s.player_last_action in ("defend", "parry") else 0.5,
-            execute_note="Spidey lunges with venomous fangs!",
-            dmg_range=(600, 1000)
-        ),
-        "leg_stab": BossMove(
-            "leg_stab",
-            priority=lambda s: 0.7 if s.player_last_action == "counter" else 0.5,
-            execute_note="Spidey jabs with razor legs!",
-            dmg_range=(500, 900)
-        ),
-        "cocoon": BossMove(
-            "cocoon",
-            priority=lambda s: 0.8 if (s.boss_hp/s.boss_max_hp <= 0.3) else 0,
-            execute_note="Spidey spins a cocoon to shield itself.",
-            dmg_range=(-400, 0),
-            heal_move=True
-        ),
-    }
+    return SPIDEY_MOVES
 
 # ----------------------
 # Style & Utils
@@ -154,10 +249,80 @@ class style():
 
 def typewriter(text, color=style.RESET, delay=0.02, post_delay=0.5):
     for c in text:
-        print(f"{color}{c}{style.RESET}", end='', flush=True)
-        time.sleep(delay)
-    print()
-    time.sleep(post_delay)
+        output.write(f"{color}{c}{style.RESET}")
+        output.flush()
+        output.sleep(delay)
+    output.write("\n")
+    output.flush()
+    output.sleep(post_delay)
+
+# ----------------------
+# Drago fight engine
+# ----------------------
+# Shared by the interactive fight below and the headless simulator in
+# bosssim.py. `game` only needs "hp", "max_hp", "level", "weapons",
+# "equipped" and "skill_set". Turns return (kind, value) event tuples.
+@dataclass
+class DragoFight:
+    boss_hp: int = 2500
+    boss_max_hp: int = 2500
+    cooldowns: Dict[str, int] = field(default_factory=lambda: {"charge":0, "flame_breath":0, "tail_swipe":0, "wing_attack":0, "heal":0})
+    is_charging: bool = False
+    enraged: bool = False
+    turn: int = 1
+    player_last_action: str = ""
+
+def clamp_hp(fight, game):
+    game["hp"] = max(0, min(game["hp"], game["max_hp"]))
+    fight.boss_hp = max(0, min(fight.boss_hp, fight.boss_max_hp))
+
+def start_round(fight):
+    fight.enraged = fight.enraged or fight.boss_hp <= fight.boss_max_hp*0.35
+    for k in fight.cooldowns: fight.cooldowns[k] = max(0, fight.cooldowns[k]-1)
+
+def player_turn(fight, game, action, rng=combat_rng):
+    """Resolve the player's action. Items are applied by the caller beforehand."""
+    events = []
+    if action == "attack":
+        if rng.randint(0,100) < (75 - 3*game['level'] + 5*game['skill_set']['accuracy']):
+            weapon = game["weapons"][game["equipped"]]
+            dmg = rng.randint(
+                weapon[1] + 5*game['skill_set']['strength'],
+                weapon[2] + 5*game['skill_set']['strength']
+            )
+            fight.boss_hp -= dmg
+            events.append(("player_hit", dmg))
+            if fight.is_charging and rng.randint(0,100) < 85:
+                fight.is_charging = False; fight.cooldowns["flame_breath"]=2
+                events.append(("interrupt", 0))
+        else:
+            events.append(("player_miss", 0))
+    elif action != "use item":
+        events.append(("prepare", action))
+
+    fight.player_last_action = action
+    return events
+
+def boss_turn(fight, game, moves, rng=combat_rng, ai_rng=boss_rng):
+    """Let the boss pick and play a move, then advance the turn counter."""
+    state = BossState(fight.turn, fight.boss_hp, fight.boss_max_hp, game["hp"],
+                      fight.player_last_action, fight.is_charging, fight.enraged, fight.cooldowns.copy())
+    chosen_move, _ = boss_pick_action(state, moves, ai_rng)
+
+    events = [("boss_move", chosen_move)]
+    if chosen_move.heal_move:
+        heal_amt = abs(ai_rng.randint(*chosen_move.dmg_range))
+        fight.boss_hp = min(fight.boss_hp + heal_amt, fight.boss_max_hp)
+        events.append(("boss_heal", heal_amt))
+    else:
+        raw = rng.randint(int(chosen_move.dmg_range[0]), int(chosen_move.dmg_range[1]))
+        dmg = max(0, round(raw - 5*game['skill_set']['defence']))
+        game["hp"] -= dmg
+        events.append(("boss_hit", dmg))
+
+    clamp_hp(fight, game)
+    fight.turn += 1
+    return events
 
 # ----------------------
 # Boss Fight: Drago (Lv25)
@@ -168,84 +333,56 @@ def lv_25_boss_fight(game, use_item):
     # cinematic intro
     line = "-"*35
     line2 = "="*35
-    sys.stdout.write(style.RED + style.BOLD)
-    for char in line: sys.stdout.write(char); sys.stdout.flush(); time.sleep(0.5)
-    sys.stdout.write("\r" + style.GREEN + style.BOLD)
-    for char in line2: sys.stdout.write(char); sys.stdout.flush(); time.sleep(0.05)
-    sys.stdout.write("\r" + style.GREEN + style.BOLD)
-    for s in range(500): sys.stdout.write(str(r.randint(0,1))); sys.stdout.flush(); time.sleep(1/(s+1))
+    output.write(style.RED + style.BOLD)
+    for char in line: output.write(char); output.flush(); output.sleep(0.5)
+    output.write("\r" + style.GREEN + style.BOLD)
+    for char in line2: output.write(char); output.flush(); output.sleep(0.05)
+    output.write("\r" + style.GREEN + style.BOLD)
+    for s in range(500): output.write(str(animation_rng.randint(0,1))); output.flush(); output.sleep(1/(s+1))
     os.system("cls")
     animate_emerge_from_binary()
 
-    drago = {"name": "Drago the Eternal", "hp": 2500, "max_hp": 2500}
-    player_weapon = game["weapons"][game["equipped"]]
-    cooldowns = {"charge":0, "flame_breath":0, "tail_swipe":0, "wing_attack":0, "heal":0}
-    is_charging, enraged, turn, player_last_action = False, False, 1, ""
+    name = "Drago the Eternal"
+    fight = DragoFight()
     moves = get_drago_moves()
 
-    def clamp_hp():
-        game["hp"] = max(0, min(game["hp"], game["max_hp"]))
-        drago["hp"] = max(0, min(drago["hp"], drago["max_hp"]))
-
-    def player_roll_damage():
-        return r.randint(
-            player_weapon[1] + 5*game['skill_set']['strength'],
-            player_weapon[2] + 5*game['skill_set']['strength']
-        )
-
-    def boss_roll_damage(min_d, max_d, mult=1.0):
-        raw = r.randint(int(min_d), int(max_d))
-        return max(0, round(raw*mult - 5*game['skill_set']['defence']))
-
     def print_status():
-        typewriter(f"Your HP: {game['hp']} | {drago['name']} HP: {drago['hp']}", style.YELLOW)
+        typewriter(f"Your HP: {game['hp']} | {name} HP: {fight.boss_hp}", style.YELLOW)
 
-    typewriter(f"{drago['name']} descends. The air shimmers with heat...", style.MAGENTA)
+    typewriter(f"{name} descends. The air shimmers with heat...", style.MAGENTA)
 
-    while drago["hp"] > 0 and game["hp"] > 0:
-        enraged = enraged or drago["hp"] <= drago["max_hp"]*0.35
-        for k in cooldowns: cooldowns[k] = max(0, cooldowns[k]-1)
+    while fight.boss_hp > 0 and game["hp"] > 0:
+        start_round(fight)
 
         # --- Player turn ---
         print_status()
         action = input("Do (attack/defend/parry/counter/use item): ").strip().lower()
-        if action == "attack":
-            if r.randint(0,100) < (75 - 3*game['level'] + 5*game['skill_set']['accuracy']):
-                dmg = player_roll_damage()
-                drago["hp"] -= dmg
+        if action == "use item":
+            game = use_item(game); clamp_hp(fight, game)
+        for kind, value in player_turn(fight, game, action):
+            if kind == "player_hit":
                 animate_get_hit_by_sword()
-                typewriter(f"You slash for {dmg}!", style.GREEN)
-                if is_charging and r.randint(0,100) < 85:
-                    is_charging = False; cooldowns["flame_breath"]=2
-                    typewriter("You interrupt the charge!", style.CYAN)
-            else:
+                typewriter(f"You slash for {value}!", style.GREEN)
+            elif kind == "interrupt":
+                typewriter("You interrupt the charge!", style.CYAN)
+            elif kind == "player_miss":
                 typewriter("You miss!", style.RED); animate_dodge_sword()
-        elif action == "use item":
-            game = use_item(game); clamp_hp()
-        else:
-            typewriter(f"You prepare to {action}.", style.BLUE)
+            elif kind == "prepare":
+                typewriter(f"You prepare to {value}.", style.BLUE)
 
-        player_last_action = action
-        if drago["hp"] <= 0: break
+        if fight.boss_hp <= 0: break
 
         # --- Boss turn ---
-        state = BossState(turn, drago["hp"], drago["max_hp"], game["hp"],
-                          player_last_action, is_charging, enraged, cooldowns.copy())
-        chosen_move, ai_note = boss_pick_action(state, moves)
-
-        typewriter(ai_note, style.YELLOW)
-        if chosen_move.heal_move:
-            heal_amt = abs(r.randint(*chosen_move.dmg_range))
-            drago["hp"] = min(drago["hp"] + heal_amt, drago["max_hp"])
-            typewriter(f"{drago['name']} heals for {heal_amt}!", style.GREEN)
-        else:
-            dmg = boss_roll_damage(*chosen_move.dmg_range)
-            game["hp"] -= dmg
-            animate_hit(1)
-            typewriter(f"{drago['name']} uses {chosen_move.name} for {dmg}!", style.RED)
+        for kind, value in boss_turn(fight, game, moves):
+            if kind == "boss_move":
+                chosen_move = value
+                typewriter(chosen_move.execute_note, style.YELLOW)
+            elif kind == "boss_heal":
+                typewriter(f"{name} heals for {value}!", style.GREEN)
+            elif kind == "boss_hit":
+                animate_hit(1)
+                typewriter(f"{name} uses {chosen_move.name} for {value}!", style.RED)
 
-        clamp_hp()
-        turn += 1
         time.sleep(0.6)
 
     if game["hp"] > 0:
@@ -0,0 +1,163 @@
+"""
+Headless batch simulator for the Drago level-25 boss fight.
+
+Runs the same DragoFight / boss_pick_action / cooldown / enrage /
+charge-interrupt rules as bossfights.lv_25_boss_fight, without the intro,
+animations or typewriter text, with a pluggable player policy. Reports win
+rate, the turn-count distribution and how often Drago used each move, for one
+build or a sweep of builds spread over every core.
+
+Run: python3 bosssim.py --weapon 150 300 --skills 5 0 0 5 5 --hp 2000
+     python3 bosssim.py --sweep --fights 500 --sweep-accuracy 5 10 15
+"""
+
+import argparse
+import multiprocessing
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+
+import bossfights
+import randomness
+
+SKILLS = ["strength", "agility", "luck", "accuracy", "defence"]
+
+# ----------------------
+# Builds and policies
+# ----------------------
+@dataclass(frozen=True)
+class Build:
+    weapon_min: int
+    weapon_max: int
+    skill_set: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(SKILLS, 0))
+    hp: int = 1000
+    level: int = 25
+
+    def game(self):
+        """Fresh minimal game dict for one fight."""
+        return {
+            "hp": self.hp,
+            "max_hp": self.hp,
+            "level": self.level,
+            "weapons": [["Weapon", self.weapon_min, self.weapon_max]],
+            "equipped": 0,
+            "skill_set": dict(self.skill_set),
+        }
+
+def always_attack(fight, game):
+    return "attack"
+
+def cautious(fight, game):
+    """Attack, but defend while under a third of max HP."""
+    return "defend" if game["hp"] < game["max_hp"] / 3 else "attack"
+
+def counter_on_charge(fight, game):
+    """Attack, and counter while Drago is charging or enraged."""
+    return "counter" if fight.is_charging or fight.enraged else "attack"
+
+# Policies by name so sweeps can hand them to worker processes
+POLICIES: Dict[str, Callable] = {
+    "attack": always_attack,
+    "cautious": cautious,
+    "counter": counter_on_charge,
+}
+
+@dataclass
+class BossReport:
+    build: Build
+    fights: int = 0
+    wins: int = 0
+    turns: Counter = field(default_factory=Counter)        # player turns played -> fights
+    move_usage: Counter = field(default_factory=Counter)   # move name -> times used
+
+    @property
+    def win_rate(self):
+        return self.wins / self.fights if self.fights else 0.0
+
+    @property
+    def mean_turns(self):
+        return sum(t * n for t, n in self.turns.items()) / self.fights if self.fights else 0.0
+
+# ----------------------
+# Simulation
+# ----------------------
+def simulate_boss(build: Build, policy="attack", fights: int = 1000, streams=None, max_turns: int = 500) -> BossReport:
+    """Play `fights` Drago fights for `build` and collect a BossReport.
+
+    `policy` is a POLICIES name or a callable (fight, game) -> action.
+    `streams` is the randomness.RngService to draw from, the game's own by
+    default. Items are not modelled, "use item" just passes the turn.
+    """
+    policy = POLICIES[policy] if isinstance(policy, str) else policy
+    streams = streams or randomness.service
+    combat_rng = streams.stream("combat")
+    boss_rng = streams.stream("boss_ai")
+    moves = bossfights.get_drago_moves()
+    report = BossReport(build)
+
+    for _ in range(fights):
+        game = build.game()
+        fight = bossfights.DragoFight()
+        # Player turns played, fight.turn only moves on after the boss's turn
+        turns = 0
+        while fight.boss_hp > 0 and game["hp"] > 0 and turns < max_turns:
+            bossfights.start_round(fight)
+            bossfights.player_turn(fight, game, policy(fight, game), combat_rng)
+            turns += 1
+            if fight.boss_hp <= 0:
+                break
+            events = bossfights.boss_turn(fight, game, moves, combat_rng, boss_rng)
+            report.move_usage[events[0][1].name] += 1
+
+        report.fights += 1
+        report.wins += game["hp"] > 0 and fight.boss_hp <= 0
+        report.turns[turns] += 1
+    return report
+
+def _simulate(args):
+    index, build, policy, fights, seed = args
+    return index, simulate_boss(build, policy, fights, randomness.RngService(seed).split(index))
+
+def sweep(builds: List[Build], policy: str = "attack", fights: int = 1000, seed: int = 0, workers=None) -> List[BossReport]:
+    """simulate_boss for every build over a process pool, in build order.
+
+    Build i draws from split i of `seed`, so results do not depend on how
+    the builds were spread over workers.
+    """
+    jobs = [(i, build, policy, fights, seed) for i, build in enumerate(builds)]
+    reports = [None] * len(builds)
+    with multiprocessing.Pool(workers) as pool:
+        for index, report in pool.imap_unordered(_simulate, jobs):
+            reports[index] = report
+    return reports
+
+def print_report(report):
+    b = report.build
+    skills = " ".join(f"{k[:3]}={v}" for k, v in b.skill_set.items())
+    print(f"weapon {b.weapon_min}-{b.weapon_max} hp {b.hp} {skills}: win {report.win_rate:.1%}, mean turns {report.mean_turns:.1f}")
+    total = sum(report.move_usage.values()) or 1
+    print("  moves: " + ", ".join(f"{name} {n / total:.1%}" for name, n in report.move_usage.most_common()))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless Drago boss fight simulator")
+    parser.add_argument("--weapon", type=int, nargs=2, default=[150, 300], metavar=("MIN", "MAX"))
+    parser.add_argument("--skills", type=int, nargs=5, default=[0, 0, 0, 0, 0], metavar=("STR", "AGI", "LUCK", "ACC", "DEF"))
+    parser.add_argument("--hp", type=int, default=1000)
+    parser.add_argument("--policy", choices=list(POLICIES), default="attack")
+    parser.add_argument("--fights", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sweep", action="store_true", help="sweep strength and defence 0-9 and --sweep-accuracy around --weapon/--hp")
+    parser.add_argument("--sweep-accuracy", type=int, nargs="+", default=[5, 10, 15], metavar="ACC",
+                        help="accuracy values to sweep, at level 25 each point is +5%% hit chance from 0")
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args()
+
+    base = dict(zip(SKILLS, args.skills))
+    if args.sweep:
+        builds = [Build(args.weapon[0], args.weapon[1], {**base, "strength": st, "accuracy": ac, "defence": de}, args.hp)
+                  for ac in args.sweep_accuracy for st in range(10) for de in range(10)]
+        for report in sweep(builds, args.policy, args.fights, args.seed, args.workers):
+            print_report(report)
+    else:
+        print_report(simulate_boss(Build(args.weapon[0], args.weapon[1], base, args.hp), args.policy, args.fights,
+                                   randomness.RngService(args.seed)))
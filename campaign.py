@@ -0,0 +1,269 @@
+"""
+Whole-run campaign simulator.
+
+Plays seeded level 1 to 25 playthroughs with a simple bot (explore, shop,
+level up, drink potions, run from fights it is losing) on top of the
+headless battle engine, spreads them over every core with a process pool
+and merges the per-run summaries into aggregate stats: explores and gold
+when each level is reached, and the level runs die at.
+
+Every finished run is appended to a JSON lines results file as soon as it
+comes back, so an interrupted campaign picks up where it stopped when run
+again with the same file.
+
+Run: python3 campaign.py --runs 2000 --out campaign.jsonl
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterable
+
+import battle
+import items
+import monsters
+import randomness
+import rpg
+
+BOSS_LEVEL = 25
+
+# Heal per potion, best first
+POTIONS = items.POTIONS
+
+# ----------------------
+# Bot
+# ----------------------
+@dataclass(frozen=True)
+class Policy:
+    battle_action: str = "counter"  # action used every battle turn
+    flee_below: float = 0.5         # run from a monster under this fraction of max HP
+    heal_below: float = 0.5         # drink a potion under this fraction of max HP
+    potion_stock: int = 3           # potions to keep in the bag
+    skill: str = "accuracy"         # skill picked on every level up
+    buy_level_ups: bool = False     # buy LaDoodle's "Level Up" when affordable
+    max_explores: int = 5000
+
+def _level_up(game, policy):
+    # Same rules as rpg.level_up_check, minus the prompts
+    while game["xp"] >= 200 * game["level"]:
+        game["xp"] -= 200 * game["level"]
+        game["level"] += 1
+        game["max_hp"] += round(game["max_hp"] * 0.2)
+        game["hp"] = game["max_hp"]
+        game["skill_set"][policy.skill] += 1
+
+def _heal(game, policy):
+    while game["hp"] < game["max_hp"] * policy.heal_below:
+        potion = next((p for p in POTIONS if p in game["inventory"]), None)
+        if potion is None:
+            return
+        items.use(game, potion)
+
+def _battle_policy(game, policy):
+    """Battle policy for battle.fight: the policy's action, running once HP drops under flee_below."""
+    flee_at = game["max_hp"] * policy.flee_below
+    action = policy.battle_action
+
+    def choose(setup, state):
+        return "run" if state.player_hp < flee_at else action
+    return choose
+
+def _shop(game, policy):
+    stock = [item for item in rpg.SHOP_ITEMS if item[2] <= game["level"]]
+
+    # Upgrade to the strongest affordable weapon
+    best = game["weapons"][game["equipped"]]
+    for name, cost, _ in stock:
+        weapon = rpg.WEAPON_STATS.get(name)
+        if weapon and weapon[2] > best[2] and cost <= game["gold"]:
+            game["gold"] -= cost
+            game["weapons"].append(list(weapon))
+            game["equipped"] = len(game["weapons"]) - 1
+            best = weapon
+
+    # Top potions back up with the best one on the shelf
+    potions = [item for item in stock if item[0] in POTIONS]
+    if potions:
+        name, cost, _ = max(potions, key=lambda item: POTIONS[item[0]])
+        held = sum(game["inventory"].count(p) for p in POTIONS)
+        count = min(policy.potion_stock - held, game["gold"] // cost)
+        if count > 0:
+            game["gold"] -= cost * count
+            game["inventory"].add(name, count)
+
+def _explore(game, policy, streams):
+    level = game["level"]
+    encounter_rng = streams.stream("encounter")
+    i = encounter_rng.randint(0, 100)
+    if i <= max(43, 89 - 2*level):
+        i = encounter_rng.randint(0, 100)
+        for template in monsters.encounter(level, i):
+            if game["hp"] > 0:
+                _heal(game, policy)
+                setup = battle.setup_from_game(game, template.name, template.damage)
+                state = battle.fight(setup, battle.BattleState(game["hp"], template.hp), _battle_policy(game, policy), streams.stream("combat"))
+                game["hp"] = state.player_hp
+                if state.outcome == battle.WON:
+                    game["gold"] += template.reward
+                    game["xp"] += template.xp
+    elif i <= max(77, 99 - 2*level):
+        game["gold"] += streams.stream("loot").randint(0, 200) + level * 10
+    elif policy.buy_level_ups and game["gold"] >= 500 * level:
+        game["gold"] -= 500 * level
+        game["level"] += 1
+
+def play_campaign(base_seed, index, policy=Policy()):
+    """Play run `index` of the campaign seeded `base_seed` and return its summary dict.
+
+    Each run draws from its own randomness split, so runs are independent
+    and any one of them can be replayed on its own. level_explores[n] and
+    level_gold[n] are the explore count and gold when level n was first
+    reached (None if it never was).
+    """
+    streams = randomness.RngService(base_seed).split(index)
+    game = rpg.init_new_game()
+    game["autosave"]["filename"] = None
+    level_explores = [None] * (BOSS_LEVEL + 1)
+    level_gold = [None] * (BOSS_LEVEL + 1)
+    level_explores[1], level_gold[1] = 0, 0
+
+    explores = 0
+    while game["level"] < BOSS_LEVEL and explores < policy.max_explores:
+        _heal(game, policy)
+        _shop(game, policy)
+        _heal(game, policy)
+        before = game["level"]
+        _explore(game, policy, streams)
+        explores += 1
+        if game["hp"] <= 0:
+            break
+        _level_up(game, policy)
+        for level in range(before + 1, min(game["level"], BOSS_LEVEL) + 1):
+            level_explores[level], level_gold[level] = explores, game["gold"]
+
+    return {
+        "seed": f"{base_seed}:{index}",
+        "policy": asdict(policy),
+        "died": game["hp"] <= 0,
+        "final_level": game["level"],
+        "reached_boss": game["level"] >= BOSS_LEVEL,
+        "explores": explores,
+        "level_explores": level_explores,
+        "level_gold": level_gold,
+    }
+
+def _play(args):
+    base_seed, index, policy = args
+    return play_campaign(base_seed, index, Policy(**policy))
+
+# ----------------------
+# Aggregation
+# ----------------------
+def aggregate(summaries: Iterable[dict]) -> dict:
+    """Merge run summaries into per-level means and a death level histogram."""
+    runs = deaths = boss = 0
+    death_levels: Dict[int, int] = {}
+    reached = [0] * (BOSS_LEVEL + 1)
+    explores_sum = [0] * (BOSS_LEVEL + 1)
+    gold_sum = [0] * (BOSS_LEVEL + 1)
+
+    for s in summaries:
+        runs += 1
+        boss += s["reached_boss"]
+        if s["died"]:
+            deaths += 1
+            death_levels[s["final_level"]] = death_levels.get(s["final_level"], 0) + 1
+        for level in range(1, BOSS_LEVEL + 1):
+            if s["level_explores"][level] is not None:
+                reached[level] += 1
+                explores_sum[level] += s["level_explores"][level]
+                gold_sum[level] += s["level_gold"][level]
+
+    return {
+        "runs": runs,
+        "death_rate": deaths / runs if runs else 0.0,
+        "boss_rate": boss / runs if runs else 0.0,
+        "death_levels": dict(sorted(death_levels.items())),
+        "levels": {
+            level: {
+                "reached": reached[level] / runs,
+                "mean_explores": explores_sum[level] / reached[level],
+                "mean_gold": gold_sum[level] / reached[level],
+            }
+            for level in range(1, BOSS_LEVEL + 1) if reached[level]
+        },
+    }
+
+def _read_results(path):
+    summaries = []
+    if not os.path.exists(path):
+        return summaries
+    good = 0
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                summaries.append(json.loads(line))
+            except ValueError:
+                break
+            good += len(line)
+    # Drop a line cut short by an interrupted run, that run just gets played again
+    if good != os.path.getsize(path):
+        with open(path, "r+b") as f:
+            f.truncate(good)
+    return summaries
+
+def run_campaigns(runs, base_seed=0, policy=Policy(), out=None, workers=None) -> dict:
+    """Play `runs` seeded campaigns over a process pool and return aggregate().
+
+    Run i plays from randomness split i of base_seed and is recorded as
+    f"{base_seed}:{i}". With `out`, summaries already in that file for runs
+    0 to runs-1 of this seed played with this same policy are reused, and
+    new ones are appended as they finish.
+    """
+    wanted = {f"{base_seed}:{i}" for i in range(runs)}
+    settings = asdict(policy)
+    done = {}
+    for s in _read_results(out) if out else ():
+        if s["seed"] in wanted and s.get("policy") == settings:
+            done[s["seed"]] = s
+    todo = [(base_seed, i, settings) for i in range(runs) if f"{base_seed}:{i}" not in done]
+
+    summaries = list(done.values())
+    if todo:
+        sink = open(out, "a") if out else None
+        try:
+            with multiprocessing.Pool(workers) as pool:
+                chunksize = max(1, len(todo) // ((workers or os.cpu_count() or 1) * 8))
+                for summary in pool.imap_unordered(_play, todo, chunksize):
+                    summaries.append(summary)
+                    if sink:
+                        sink.write(json.dumps(summary) + "\n")
+                        sink.flush()
+        finally:
+            if sink:
+                sink.close()
+    return aggregate(summaries)
+
+def print_report(stats):
+    print(f"Runs: {stats['runs']}  died: {stats['death_rate']:.1%}  reached boss: {stats['boss_rate']:.1%}")
+    print(f"  {'level':>5} {'reached':>8} {'explores':>9} {'gold':>9}")
+    for level, s in stats["levels"].items():
+        print(f"  {level:>5} {s['reached']:>8.1%} {s['mean_explores']:>9.1f} {s['mean_gold']:>9.1f}")
+    print("  Deaths by level: " + ", ".join(f"{lv}: {n}" for lv, n in stats["death_levels"].items()))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate full level 1 to 25 playthroughs")
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="JSON lines file for per-run summaries, reused to resume")
+    parser.add_argument("--workers", type=int, help="worker processes, defaults to every core")
+    parser.add_argument("--action", choices=["attack", "counter"], default=Policy.battle_action)
+    parser.add_argument("--flee-below", type=float, default=Policy.flee_below, help="run from a monster under this fraction of max HP, 0 never runs")
+    parser.add_argument("--skill", choices=["strength", "agility", "luck", "accuracy", "defence"], default="accuracy")
+    parser.add_argument("--buy-level-ups", action="store_true")
+    args = parser.parse_args()
+
+    policy = Policy(battle_action=args.action, flee_below=args.flee_below, skill=args.skill, buy_level_ups=args.buy_level_ups)
+    print_report(run_campaigns(args.runs, args.seed, policy, args.out, args.workers))
@@ -0,0 +1,227 @@
+"""
+Game content (monsters, shop stock, spells) read from the JSON files in data/.
+
+Each file carries a "version" and is validated and compiled into plain
+tuples and dicts the first time it is seen. The compiled form is pickled to
+data/.cache/ under a hash of the file's bytes, so later startups load it
+straight from the cache and only re-read the JSON after someone edits it.
+Designers can change balance in data/ without touching code.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from typing import Callable, Dict
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+CACHE_DIR = os.path.join(DATA_DIR, ".cache")
+
+# Data file version this code reads
+VERSION = 1
+# Bump when a compiler's output changes shape, so old caches are ignored
+CACHE_FORMAT = 1
+
+class ContentError(ValueError):
+    pass
+
+# ----------------------
+# Validation helpers
+# ----------------------
+def _require(cond, name, message):
+    if not cond:
+        raise ContentError(f"data/{name}.json: {message}")
+
+def _int(value, name, where, minimum=0):
+    _require(isinstance(value, int) and not isinstance(value, bool) and value >= minimum,
+             name, f"{where} must be an integer >= {minimum}, got {value!r}")
+    return value
+
+def _str(value, name, where):
+    _require(isinstance(value, str) and value, name, f"{where} must be a non-empty string, got {value!r}")
+    return value
+
+def _entry(value, name, where):
+    _require(isinstance(value, dict), name, f"{where} must be an object, got {value!r}")
+    return value
+
+def _damage(entry, name, where):
+    _entry(entry, name, where)
+    low = _int(entry.get("min"), name, f"{where} min")
+    high = _int(entry.get("max"), name, f"{where} max")
+    _require(low <= high, name, f"{where} min is above max")
+    return low, high
+
+# ----------------------
+# Compilers, one per data file
+# ----------------------
+def _compile_monsters(doc):
+    """Tiers of (name, hp, damage, reward, chance, xp) rows, chances ascending."""
+    tiers = doc.get("tiers")
+    _require(isinstance(tiers, list) and tiers, "monsters", "needs a non-empty tiers list")
+    compiled = []
+    for t, tier in enumerate(tiers):
+        rows = tier.get("monsters") if isinstance(tier, dict) else None
+        _require(isinstance(rows, list) and rows, "monsters", f"tier {t} needs a non-empty monsters list")
+        out = []
+        for n, m in enumerate(rows):
+            _entry(m, "monsters", f"tier {t} monster {n}")
+            where = f"tier {t} monster {m.get('name')!r}"
+            out.append((
+                _str(m.get("name"), "monsters", f"tier {t} name"),
+                _int(m.get("hp"), "monsters", f"{where} hp", 1),
+                _int(m.get("damage"), "monsters", f"{where} damage"),
+                _int(m.get("reward"), "monsters", f"{where} reward"),
+                _int(m.get("chance"), "monsters", f"{where} chance"),
+                _int(m.get("xp"), "monsters", f"{where} xp"),
+            ))
+        chances = [row[4] for row in out]
+        _require(chances == sorted(chances), "monsters", f"tier {t} chances must be ascending")
+        _require(chances[-1] >= 100, "monsters", f"tier {t} last chance must be at least 100")
+        compiled.append(tuple(out))
+    return tuple(compiled)
+
+def _compile_shop(doc):
+    """TheDoodleShop™ stock as (name, cost, level) and weapon stats as (name, min, max)."""
+    items = doc.get("items")
+    weapons = doc.get("weapons")
+    _require(isinstance(items, list) and items, "shop", "needs a non-empty items list")
+    _require(isinstance(weapons, dict), "shop", "needs a weapons table")
+    for n, i in enumerate(items):
+        _entry(i, "shop", f"item {n}")
+    stock = tuple(
+        (_str(i.get("name"), "shop", "item name"),
+         _int(i.get("cost"), "shop", f"{i.get('name')!r} cost"),
+         _int(i.get("level"), "shop", f"{i.get('name')!r} level", 1))
+        for i in items
+    )
+    names = {item[0] for item in stock}
+    stats = {}
+    for name, entry in weapons.items():
+        _require(name in names, "shop", f"weapon {name!r} is not sold in the shop")
+        stats[name] = (name, *_damage(entry, "shop", f"weapon {name!r}"))
+    return {"items": stock, "weapons": stats}
+
+def _compile_cozycoder(doc):
+    """Noah's shop, item name -> {"cost", "type", "stats", "note"} in display order."""
+    items = doc.get("items")
+    _require(isinstance(items, dict) and items, "cozycoder", "needs a non-empty items table")
+    compiled = {}
+    for name, entry in items.items():
+        kind = _entry(entry, "cozycoder", f"{name!r}").get("type")
+        _require(kind in ("weapon", "item"), "cozycoder", f"{name!r} type must be weapon or item")
+        data = {"cost": _int(entry.get("cost"), "cozycoder", f"{name!r} cost"), "type": kind}
+        if kind == "weapon":
+            stats = entry.get("stats")
+            _require(isinstance(stats, list) and len(stats) == 2, "cozycoder", f"{name!r} needs [min, max] stats")
+            data["stats"] = _damage({"min": stats[0], "max": stats[1]}, "cozycoder", f"{name!r}")
+        if "note" in entry:
+            data["note"] = _str(entry["note"], "cozycoder", f"{name!r} note")
+        compiled[name] = data
+    return compiled
+
+def _compile_ladoodle(doc):
+    """LaDoodle's per level prices and the Pen's damage range."""
+    prices = doc.get("prices_per_level")
+    _require(isinstance(prices, dict) and prices, "ladoodle", "needs a prices_per_level table")
+    for item in ("Pen", "Level Up"):
+        _require(item in prices, "ladoodle", f"prices_per_level is missing {item!r}")
+    return {
+        "prices_per_level": {name: _int(cost, "ladoodle", f"{name!r} price") for name, cost in prices.items()},
+        "pen": ("Pen", *_damage(doc.get("pen") or {}, "ladoodle", "pen")),
+    }
+
+def _compile_spells(doc):
+    """Beginner's Scroll spells as (name, min, max) plus their draw weights."""
+    spells = doc.get("beginners_scroll")
+    _require(isinstance(spells, list) and spells, "spells", "needs a non-empty beginners_scroll list")
+    for n, s in enumerate(spells):
+        _entry(s, "spells", f"spell {n}")
+    return {
+        "beginners_scroll": tuple((_str(s.get("name"), "spells", "spell name"), *_damage(s, "spells", f"spell {s.get('name')!r}")) for s in spells),
+        "beginners_scroll_weights": tuple(_int(s.get("weight"), "spells", f"spell {s.get('name')!r} weight", 1) for s in spells),
+    }
+
+COMPILERS: Dict[str, Callable] = {
+    "monsters": _compile_monsters,
+    "shop": _compile_shop,
+    "cozycoder": _compile_cozycoder,
+    "ladoodle": _compile_ladoodle,
+    "spells": _compile_spells,
+}
+
+# ----------------------
+# Loading and caching
+# ----------------------
+_loaded = {}
+
+def _cache_path(name, raw):
+    digest = hashlib.blake2b(raw, digest_size=16)
+    digest.update(f"{name}/{CACHE_FORMAT}".encode())
+    return os.path.join(CACHE_DIR, f"{name}-{digest.hexdigest()}.pickle")
+
+def _write_cache(name, path, compiled):
+    # Best effort, a read-only install just compiles on every start
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(compiled, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        for old in os.listdir(CACHE_DIR):
+            if old.startswith(f"{name}-") and os.path.join(CACHE_DIR, old) != path:
+                os.remove(os.path.join(CACHE_DIR, old))
+    except OSError:
+        pass
+
+def compile_file(name):
+    """Parse and validate data/<name>.json and return its compiled form, skipping the cache."""
+    with open(os.path.join(DATA_DIR, f"{name}.json"), "rb") as f:
+        return _compile(name, f.read())
+
+def _compile(name, raw):
+    try:
+        doc = json.loads(raw)
+    except ValueError as e:
+        raise ContentError(f"data/{name}.json: {e}") from None
+    _require(isinstance(doc, dict), name, "must be a JSON object")
+    _require(doc.get("version") == VERSION, name, f"unsupported version {doc.get('version')!r}, expected {VERSION}")
+    return COMPILERS[name](doc)
+
+def load(name):
+    """Compiled content for data/<name>.json, from memory, the cache or a fresh compile."""
+    if name in _loaded:
+        return _loaded[name]
+    if name not in COMPILERS:
+        raise ContentError(f"Unknown content file: {name}")
+
+    with open(os.path.join(DATA_DIR, f"{name}.json"), "rb") as f:
+        raw = f.read()
+    path = _cache_path(name, raw)
+    try:
+        with open(path, "rb") as f:
+            compiled = pickle.load(f)
+    except Exception:
+        # Missing, truncated or stale: unpickling garbage can raise nearly anything
+        compiled = _compile(name, raw)
+        _write_cache(name, path, compiled)
+
+    _loaded[name] = compiled
+    return compiled
+
+def check_all():
+    """Validate every data file, returns a list of error messages (empty when all good)."""
+    errors = []
+    for name in COMPILERS:
+        try:
+            compile_file(name)
+        except (OSError, ContentError) as e:
+            errors.append(str(e))
+    return errors
+
+if __name__ == "__main__":
+    problems = check_all()
+    for problem in problems:
+        print(problem)
+    print("All content files are valid." if not problems else f"{len(problems)} problem(s) found.")
@@ -4,19 +4,28 @@ Detailed ASCII dragon boss animation (single-file).
 - Idle breathing (shows "------" idle text)
 - Small "rr" growls (one-line chaotic text)
 - Big jumpscare roar with expanding colored fire
-- Prevention of overlay residue by padding every printed line
+- Only the cells that changed since the last frame are redrawn
 - Uses ANSI colors; modern terminals recommended
 
-Run: python3 dragon.py
-Stop: Ctrl+C
+Output goes through output.py, so any animation can be recorded to a cast
+file or benchmarked headless (python3 output.py --help).
 """
 
 import sys
 import time
-import random
 import shutil
 import os
 import re
+import signal
+import functools
+import itertools
+from typing import NamedTuple
+
+import output
+import randomness
+
+# Every random draw here is cosmetic and comes from the animation stream
+rng = randomness.stream("animation")
 
 # --------------------
 # Terminal / ANSI utils
@@ -42,12 +51,148 @@ def strip_ansi(s: str) -> str:
     """Return string with ANSI sequences removed (for correct visible-length)."""
     return _ANSI_RE.sub('', s)
 
+# --------------------
+# Styled text
+# --------------------
+# An empty terminal cell, (style, char)
+BLANK = ((), " ")
+
+@functools.lru_cache(maxsize=None)
+def sgr_params(code):
+    """The SGR parameters an escape string like BOLD + RED sets, as a style tuple (() for RESET)."""
+    params = ()
+    for m in re.finditer(r'\x1b\[([0-9;]*)m', code):
+        params = () if m.group(1) in ("", "0") else params + (m.group(1),)
+    return params
+
+class Line:
+    """
+    A row of styled text kept as (text, style) spans, with its visible width
+    counted as it is built. Padding, truncating and placing things on it are
+    plain arithmetic, no escape sequences need to be searched for or skipped.
+    A style is a tuple of SGR parameters, see sgr_params().
+    """
+    __slots__ = ("spans", "width")
+
+    def __init__(self, text="", style=()):
+        self.spans = []
+        self.width = 0
+        self.append(text, style)
+
+    def append(self, text, style=()):
+        """Add `text` in `style` (a style tuple or an escape string such as RED) and return the line."""
+        if isinstance(style, str):
+            style = sgr_params(style)
+        if text:
+            if self.spans and self.spans[-1][1] == style:
+                self.spans[-1] = (self.spans[-1][0] + text, style)
+            else:
+                self.spans.append((text, style))
+            self.width += len(text)
+        return self
+
+    def extend(self, other):
+        """Append every span of `other` (which is left untouched) and return the line."""
+        spans = other.spans
+        first = 0
+        if spans and self.spans and self.spans[-1][1] == spans[0][1]:
+            self.spans[-1] = (self.spans[-1][0] + spans[0][0], spans[0][1])
+            first = 1
+        self.spans.extend(spans[first:])
+        self.width += other.width
+        return self
+
+    def fit(self, cols):
+        """Copy cut or padded with spaces to exactly `cols` columns, never splitting a style."""
+        line = Line()
+        for text, style in self.spans:
+            if line.width + len(text) >= cols:
+                line.append(text[:cols - line.width], style)
+                return line
+            line.append(text, style)
+        return line.append(" " * (cols - line.width))
+
+    def cells(self, cols):
+        """Exactly `cols` (style, char) cells for the Screen."""
+        cells = []
+        for text, style in self.spans:
+            cells.extend(zip(itertools.repeat(style), text))
+            if len(cells) >= cols:
+                break
+        del cells[cols:]
+        cells.extend([BLANK] * (cols - len(cells)))
+        return cells
+
+    def render(self):
+        """The line as an ANSI string, every styled span closed with RESET."""
+        return "".join(f"\033[{';'.join(style)}m{text}{RESET}" if style else text for text, style in self.spans)
+
+    def __str__(self):
+        return self.render()
+
+class TerminalGeometry:
+    """
+    The terminal size, asked for once and then only again after it changes.
+
+    Where there is SIGWINCH a handler marks the size stale and the next
+    size() call asks the terminal again, so frames cost no syscalls and a
+    resize costs exactly one. Elsewhere (Windows) the size is re-read at
+    most every POLL_INTERVAL seconds. `generation` goes up on every change,
+    so anything laid out for one size can tell when to redo it.
+    """
+    POLL_INTERVAL = 0.5
+
+    def __init__(self):
+        self.cols, self.rows = self._query()
+        self.generation = 0
+        self._stale = False
+        self._watching = None           # None until size() first tries to install the handler
+        self._checked = time.monotonic()
+
+    @staticmethod
+    def _query():
+        try:
+            cols, rows = shutil.get_terminal_size()
+        except Exception:
+            cols, rows = 80, 24
+        return cols, rows
+
+    def _watch(self):
+        # Signal handlers can only be set from the main thread
+        try:
+            previous = signal.getsignal(signal.SIGWINCH)
+            def on_resize(signum, frame):
+                self._stale = True
+                if callable(previous):
+                    previous(signum, frame)
+            signal.signal(signal.SIGWINCH, on_resize)
+            return True
+        except (AttributeError, ValueError, OSError):
+            return False
+
+    def refresh(self):
+        """Ask the terminal for its size now, returns True when it changed."""
+        self._stale = False
+        self._checked = time.monotonic()
+        size = self._query()
+        if size == (self.cols, self.rows):
+            return False
+        self.cols, self.rows = size
+        self.generation += 1
+        return True
+
+    def size(self):
+        """(cols, rows), from the cache unless the terminal was resized."""
+        if self._watching is None:
+            self._watching = self._watch()
+        if self._stale or (not self._watching and time.monotonic() - self._checked > self.POLL_INTERVAL):
+            self.refresh()
+        return self.cols, self.rows
+
+terminal = TerminalGeometry()
+
 def get_term_size():
-    try:
-        cols, rows = shutil.get_terminal_size()
-    except Exception:
-        cols, rows = 80, 24
-    return cols, rows
+    return terminal.size()
 
 # --------------------
 # Dragon ASCII art base
@@ -76,32 +221,44 @@ DRAGON_BASE = [
 ]
 
 min_lead = min(len(l) - len(l.lstrip(' ')) for l in DRAGON_BASE if l.strip())
+DRAGON_WIDTH = max(len(l) for l in DRAGON_BASE)
 
 SWORD_BASE = ["<====|---"]
 
 # --------------------
 # Frame generator helpers
 # --------------------
+# Dragon variants kept by dragon_frame, there are 48 per shift_left value
+DRAGON_CACHE_SIZE = 256
+# Build the unshifted variants at import so the first roar doesn't pay for them
+PREWARM_FRAMES = True
+
 def dragon_frame(idle_phase=0, mouth_open=0, eye_fierce=False, shift_left=0, hurt=False):
     """
-    Produce a frame (list of lines) from the base art with small changes:
+    Produce a frame (tuple of lines) from the base art with small changes:
     - idle_phase toggles small chest/tail breathing shifts
     - mouth_open: 0 (closed), 1 (small), 2 (wide)
     - eye_fierce: toggles fiercer eyes for roaring
     - shift_left: shift the art left by removing leading spaces (up to min_lead)
     - hurt: changes eyes to hurt expression
+    The result only depends on idle_phase's parity and whether it is a
+    multiple of 5, so every variant is built once and cached, see dragon_cache_info().
     """
+    return _dragon_variant(idle_phase % 2 == 1, idle_phase % 5 == 0, mouth_open, bool(eye_fierce), shift_left, bool(hurt))
+
+@functools.lru_cache(maxsize=DRAGON_CACHE_SIZE)
+def _dragon_variant(puff, blink, mouth_open, eye_fierce, shift_left, hurt):
     lines = [l[shift_left:] if shift_left <= min_lead else l for l in DRAGON_BASE]
 
     # Slight chest puff effect
-    if idle_phase % 2 == 1:
+    if puff:
         lines[11] = lines[11].replace("(  |     |  )", "((  |     |  ))")
 
     # Eyes: change (@::@) to fiercer variants
     if eye_fierce:
         lines[4] = lines[4].replace("(@::@)", "(@><@)")
     else:
-        if idle_phase % 5 == 0:
+        if blink:
             lines[4] = lines[4].replace("(@::@)", "(@..@)")
 
     if hurt:
@@ -121,37 +278,111 @@ def dragon_frame(idle_phase=0, mouth_open=0, eye_fierce=False, shift_left=0, hur
         lines[6] = lines[6].replace("(oo)", "(  )")
         lines[7] = lines[7].replace("UUU", "\\_/")
 
-    return lines
+    return tuple(lines)
+
+@functools.lru_cache(maxsize=DRAGON_CACHE_SIZE)
+def line_widths(lines):
+    """Width of each line of a (cached, hashable) dragon frame, the art is plain text."""
+    return tuple(map(len, lines))
+
+def frame_width(lines):
+    return max(line_widths(tuple(lines)))
+
+def dragon_cache_info():
+    """functools cache statistics (hits, misses, maxsize, currsize) of the dragon variants."""
+    return _dragon_variant.cache_info()
+
+def prewarm_dragon_frames(shifts=(0,)):
+    """Build every dragon variant for the given shift_left values ahead of time."""
+    for shift_left in shifts:
+        for puff in (False, True):
+            for blink in (False, True):
+                for mouth_open in (0, 1, 2):
+                    for eye_fierce in (False, True):
+                        for hurt in (False, True):
+                            line_widths(_dragon_variant(puff, blink, mouth_open, eye_fierce, shift_left, hurt))
+
+if PREWARM_FRAMES:
+    prewarm_dragon_frames()
 
 def colored(text, color):
-    return f"{color}{text}{RESET}"
+    return Line(text, color)
 
 def random_roar_text(base="ra", intensity=12):
     """One-line chaotic roar text with random case and repeats."""
     out = []
     for _ in range(intensity):
-        ch = random.choice(list(base))
-        ch = ch.upper() if random.random() > 0.5 else ch.lower()
-        if random.random() > 0.7:
-            ch *= random.randint(2, 4)
+        ch = rng.choice(list(base))
+        ch = ch.upper() if rng.random() > 0.5 else ch.lower()
+        if rng.random() > 0.7:
+            ch *= rng.randint(2, 4)
         out.append(ch)
     return "".join(out)
 
 # --------------------
-# Padding renderer (prevents overlay residue)
+# Flame textures
 # --------------------
-def render_frame_padded(lines, fire_cols=0, flame_colors=None, shake=0, extra_line=None, sword_pos=None, sword_row_offset=0, sword_color=RESET, sword_lines=SWORD_BASE):
+# Flame glyphs by distance from the mouth row (0, 1, 2 and further)
+FLAME_GLYPHS = (("^", "A", "@", "*"), ("~", "`", "*", "v"), (".", " "))
+# Random rows generated per distance band, and how wide they are
+FLAME_VARIANTS = 32
+FLAME_WIDTH = 256
+
+_flame_glyphs = {}
+
+def _flame_pool(band):
+    """FLAME_VARIANTS random glyph rows for a distance band, generated on first use."""
+    pool = _flame_glyphs.get(band)
+    if pool is None:
+        glyphs = FLAME_GLYPHS[band]
+        pool = _flame_glyphs[band] = ["".join(rng.choice(glyphs) for _ in range(FLAME_WIDTH)) for _ in range(FLAME_VARIANTS)]
+    return pool
+
+@functools.lru_cache(maxsize=4096)
+def _flame_texture(band, flame_colors, variant, length):
+    glyphs = _flame_pool(band)[variant]
+    line = Line()
+    for c in range(length):
+        if band > 1:
+            color = DARK_GRAY
+        elif flame_colors:
+            color = flame_colors[c % len(flame_colors)]
+        # simple gradient: near columns hottest
+        elif c < max(1, length // 3):
+            color = YELLOW
+        elif c < max(1, 2 * length // 3):
+            color = ORANGE
+        else:
+            color = RED
+        line.append(glyphs[c % FLAME_WIDTH], color)
+    return line
+
+def flame_row(dist, length, flame_colors=None):
     """
-    Compose and return a fully padded framebuffer string:
-    - Ensures every printed row is padded to terminal width based on visible length (ANSI-stripped length).
-    - Keeps same number of lines across frames so overlay residues are cleaned.
-    - Starts with CURSOR_HOME so writing it overwrites previous frame.
+    A `length` column flame row for `dist` rows away from the mouth, colored
+    by cycling `flame_colors` (or a yellow-orange-red gradient).
+    Each call picks one of the pre-generated random rows of its band, so the
+    fire flickers like freshly rolled glyphs at the cost of a cache lookup.
+    The returned Line is shared, extend() a row with it instead of changing it.
+    """
+    return _flame_texture(min(dist, 2), tuple(flame_colors) if flame_colors else None, rng.randrange(FLAME_VARIANTS), length)
+
+# --------------------
+# Frame composition
+# --------------------
+def compose_frame(lines, fire_cols=0, flame_colors=None, shake=0, extra_line=None, sword_pos=None, sword_row_offset=0, sword_color=RESET, sword_lines=SWORD_BASE):
+    """
+    Compose one frame as a list of Lines (not padded):
+    - the dragon lines shifted right by `shake`
+    - flames appended around the mouth, limited to the terminal width
+    - the sword drawn at column `sword_pos` on its rows
+    - `extra_line` (a Line or plain text) as the last row
     """
     cols, rows = get_term_size()
 
     # Build per-line text (including appended flames where necessary)
     frame_lines = []
-    dragon_width = max(len(strip_ansi(l)) for l in lines)
+    dragon_width = max(line_widths(tuple(lines)))
 
     # Limit effective fire length to fit available columns
     max_fire = 0
@@ -159,69 +390,300 @@ def render_frame_padded(lines, fire_cols=0, flame_colors=None, shake=0, extra_li
         max_fire = min(max(0, cols - dragon_width - 1), fire_cols)
 
     mouth_anchor = 6  # approximate anchor for where to append flames
+    sword_style = sgr_params(sword_color)
 
     for idx, ln in enumerate(lines):
-        appended = ""
-        if max_fire > 0 and mouth_anchor - 1 <= idx <= mouth_anchor + 2:
-            pieces = []
-            for c in range(max_fire):
-                dist = abs(idx - mouth_anchor)
-                if dist == 0:
-                    ch = random.choice(["^", "A", "@", "*"])
-                elif dist == 1:
-                    ch = random.choice(["~", "`", "*", "v"])
-                else:
-                    ch = random.choice([".", " "])
-                if flame_colors:
-                    color = flame_colors[c % len(flame_colors)]
-                else:
-                    # simple gradient: near columns hottest
-                    if c < max(1, max_fire // 3):
-                        color = YELLOW
-                    elif c < max(1, 2 * max_fire // 3):
-                        color = ORANGE
-                    else:
-                        color = RED
-                if dist > 1:
-                    color = DARK_GRAY
-                pieces.append(f"{color}{ch}{RESET}")
-            appended = "".join(pieces)
-
         # apply horizontal shake (leading spaces)
-        lead = " " * max(0, shake)
-        composed = lead + ln + appended
+        composed = Line(" " * max(0, shake)).append(ln)
+
+        if max_fire > 0 and mouth_anchor - 1 <= idx <= mouth_anchor + 2:
+            composed.extend(flame_row(abs(idx - mouth_anchor), max_fire, flame_colors))
 
         # add sword if applicable
-        visible_len = len(strip_ansi(composed))
         if sword_pos is not None and sword_row_offset <= idx < sword_row_offset + len(sword_lines):
-            s_idx = idx - sword_row_offset
-            s_ln = sword_lines[s_idx]
-            s_composed = f"{sword_color}{s_ln}{RESET}"
-            if sword_pos >= visible_len:
-                composed += " " * round(sword_pos - visible_len) + s_composed
-
-        # measure visible width and pad to terminal cols
-        visible_len = len(strip_ansi(composed))
-        if visible_len < cols:
-            composed = composed + (" " * (cols - visible_len))
-        else:
-            # rough truncation (keeps things simple)
-            composed = composed[:cols]
+            s_ln = sword_lines[idx - sword_row_offset]
+            if sword_pos >= composed.width:
+                composed.append(" " * round(sword_pos - composed.width)).append(s_ln, sword_style)
 
         frame_lines.append(composed)
 
-    # Ensure an extra_line is also padded and added as last row
-    if extra_line is None:
-        extra_line = ""
-    v_extra = strip_ansi(extra_line)
-    if len(v_extra) < cols:
-        extra_line_padded = extra_line + (" " * (cols - len(v_extra)))
-    else:
-        extra_line_padded = extra_line[:cols]
+    frame_lines.append(extra_line if isinstance(extra_line, Line) else Line(extra_line or ""))
+    return frame_lines
+
+def render_frame_padded(lines, **kwargs):
+    """
+    compose_frame() as one fully padded framebuffer string:
+    - Every row cut or padded to exactly the terminal width.
+    - Starts with CURSOR_HOME so writing it overwrites previous frame.
+    The animations draw through a Screen instead, which only sends what changed.
+    """
+    cols, rows = get_term_size()
+    return CURSOR_HOME + "\n".join(line.fit(cols).render() for line in compose_frame(lines, **kwargs))
 
-    # Build the framebuffer. Use CURSOR_HOME to overwrite previous frame.
-    framebuffer = CURSOR_HOME + "\n".join(frame_lines + [extra_line_padded])
-    return framebuffer
+# --------------------
+# Cell-diff renderer
+# --------------------
+_ANSI_SPLIT_RE = re.compile(r'(\x1b\[[0-9;?]*[A-Za-z])')
+
+# Unchanged cells between two changes that are rewritten instead of moving the cursor
+RUN_GAP = 6
+
+def parse_cells(line, cols):
+    """Row of exactly `cols` (style, char) cells from an ANSI colored line.
+
+    A style is the tuple of SGR parameters in effect, () for the default.
+    """
+    if "\x1b" not in line:
+        return list(zip(itertools.repeat(()), line[:cols])) + [BLANK] * (cols - len(line))
+    cells = []
+    style = ()
+    for i, part in enumerate(_ANSI_SPLIT_RE.split(line)):
+        if i % 2:
+            if part[-1] == "m":
+                params = part[2:-1]
+                style = () if params in ("", "0") else style + (params,)
+        elif part:
+            cells.extend((style, ch) for ch in part)
+    del cells[cols:]
+    cells.extend([BLANK] * (cols - len(cells)))
+    return cells
+
+def _first_ink(row):
+    """Column of the first non-blank cell, len(row) for an empty row."""
+    return next((c for c, cell in enumerate(row) if cell[1] != " "), len(row))
+
+def _sgr(current, style):
+    """Shortest SGR sequence switching the terminal from `current` to `style`."""
+    if not style:
+        return RESET
+    # A new color replaces the old one, but attributes like bold need a reset to go away
+    colors = [p for p in current if p.startswith(("3", "9"))]
+    attributes = [p for p in current if p not in colors]
+    if all(p in style for p in attributes) and (not colors or any(p.startswith(("3", "9")) for p in style)):
+        return f"\033[{';'.join(style)}m"
+    return f"\033[0;{';'.join(style)}m"
+
+class Screen:
+    """
+    What is currently on the terminal, as rows of cells.
+
+    draw() takes the next frame's rows, compares them cell by cell with the
+    previous frame and writes only the runs that changed, each behind a
+    cursor-position sequence. A still dragon costs nothing, blinking eyes cost
+    a few bytes instead of the whole padded screen.
+    """
+    def __init__(self, out=None):
+        self.out = out
+        self.cells = []
+        self.generation = None          # terminal.generation the cells were drawn for
+        self.bytes_written = 0
+
+    def draw(self, lines):
+        """Show `lines` (Lines or ANSI strings, top of the screen down) and return the bytes written."""
+        cols, rows = get_term_size()
+        chunks = []
+        if terminal.generation != self.generation:
+            # First frame or a resized terminal: start from a blank screen
+            chunks.append(CLEAR_SCREEN)
+            self.cells = []
+            self.generation = terminal.generation
+
+        new = [line.cells(cols) if isinstance(line, Line) else parse_cells(line, cols) for line in lines[:rows]]
+        blank = [BLANK] * cols
+        style = ()
+        for r in range(max(len(new), len(self.cells))):
+            row = new[r] if r < len(new) else blank
+            old = self.cells[r] if r < len(self.cells) else blank
+            if row == old:
+                continue
+            changed = [c for c in range(cols) if row[c] != old[c]]
+            if len(changed) > RUN_GAP:
+                # A shaking dragon moves whole rows sideways: shift what is on the
+                # terminal with insert / delete character and only fix up the rest
+                shift = _first_ink(row) - _first_ink(old)
+                if 0 < abs(shift) < cols // 2:
+                    shifted = [BLANK] * shift + old[:cols - shift] if shift > 0 else old[-shift:] + [BLANK] * -shift
+                    still = [c for c in range(cols) if row[c] != shifted[c]]
+                    if len(still) < len(changed) // 2:
+                        chunks.append(f"\033[{r + 1};1H\033[{abs(shift)}{'@' if shift > 0 else 'P'}")
+                        changed = still
+                        if not changed:
+                            continue
+            start = end = changed[0]
+            for c in changed[1:] + [None]:
+                if c is not None and c - end <= RUN_GAP:
+                    end = c
+                    continue
+                chunks.append(f"\033[{r + 1};{start + 1}H")
+                for cell_style, ch in row[start:end + 1]:
+                    if cell_style != style:
+                        chunks.append(_sgr(style, cell_style))
+                        style = cell_style
+                    chunks.append(ch)
+                start = end = c
+        self.cells = new
+        if not chunks:
+            return 0
+
+        if style:
+            chunks.append(RESET)
+        # Leave the cursor below the frame, where the old full redraw left it
+        chunks.append(f"\033[{len(new) + 1};1H")
+        data = "".join(chunks)
+        out = self.out or output.sink
+        out.write(data)
+        out.flush()
+        size = len(data.encode())
+        self.bytes_written += size
+        return size
+
+# --------------------
+# Byte framebuffer
+# --------------------
+# Random byte -> b"0" or b"1"
+_BINARY_DIGITS = bytes(48 + (b & 1) for b in range(256))
+
+class Framebuffer:
+    """
+    A plain-character screen area held in one bytearray, row after row.
+
+    For effects that touch thousands of cells per frame (the binary void):
+    filling it with random digits is one randbytes() and one translate(),
+    a full frame is written straight from the buffer, and when the caller
+    knows which cells it changed only those are sent.
+    """
+    def __init__(self, cols, rows, out=None):
+        self.cols = cols
+        self.rows = rows
+        self.buf = bytearray(b" " * (cols * rows))
+        self.dirty = []                 # changed cells not yet sent, see write_dirty()
+        self.out = out
+
+    def fill_binary(self):
+        self.buf[:] = rng.randbytes(len(self.buf)).translate(_BINARY_DIGITS)
+
+    def _write(self, data):
+        out = self.out or output.sink
+        out.write(data)
+        out.flush()
+
+    def write_all(self, color=""):
+        """Send the whole buffer, one cursor move per row."""
+        cols = self.cols
+        text = self.buf.decode("ascii")
+        rows = (f"\033[{r + 1};1H{text[r * cols:(r + 1) * cols]}" for r in range(self.rows))
+        self._write(color + "".join(rows) + (RESET if color else ""))
+
+    def write_cells(self, indices):
+        """Send only the cells at `indices` (offsets into buf), as runs within each row."""
+        if not indices:
+            return
+        cols = self.cols
+        buf = self.buf
+        chunks = []
+        start = end = None
+        for i in sorted(indices):
+            if end is not None and i == end + 1 and i % cols:
+                end = i
+                continue
+            if start is not None:
+                chunks.append(f"\033[{start // cols + 1};{start % cols + 1}H{buf[start:end + 1].decode('ascii')}")
+            start = end = i
+        chunks.append(f"\033[{start // cols + 1};{start % cols + 1}H{buf[start:end + 1].decode('ascii')}")
+        self._write("".join(chunks))
+
+    def write_dirty(self):
+        """Send every cell listed in `dirty` since the last call."""
+        self.write_cells(self.dirty)
+        self.dirty = []
+
+    def write_at(self, row, line):
+        """Write a Line on screen row `row` (1 based), padded to the full width."""
+        self._write(f"\033[{row};1H{line.fit(self.cols).render()}")
+
+# --------------------
+# Frame pacing
+# --------------------
+# Upper bound on frames actually written per second, the sequences ask for at most 50
+TARGET_FPS = 60
+
+class FrameStats(NamedTuple):
+    frames: int         # frames the sequence asked for
+    drawn: int
+    dropped: int
+    seconds: float      # wall time the sequence took
+    fps: float          # frames drawn per second
+
+class FrameClock:
+    """
+    Fixed-timestep pacing for an animation sequence on a monotonic clock.
+
+    Each show() claims the next `duration` seconds of the sequence's own
+    timeline and sleeps until that slot ends, whatever drawing cost. A frame
+    whose slot is already over when it comes up, or that would go out less
+    than 1/fps after the previous one, is dropped: the sequence state still
+    advances, only the write is skipped. So a slow terminal shows fewer
+    frames instead of stretching the sequence. The last dropped frame is
+    drawn by the next show(), pause() or finish(), so a sequence always ends
+    on its final picture.
+    """
+    def __init__(self, fps=TARGET_FPS):
+        self.interval = 1 / fps
+        self.started = None
+        self.slot = None            # when the next frame is due
+        self.last_drawn = None
+        self.pending = None
+        self.frames = 0
+        self.drawn = 0
+
+    @property
+    def elapsed(self):
+        """Seconds of the sequence's timeline claimed so far."""
+        return 0.0 if self.started is None else self.slot - self.started
+
+    def _claim(self):
+        now = output.now()
+        if self.started is None:
+            self.started = self.slot = now
+        return now
+
+    def _draw(self, draw, args, now):
+        self.last_drawn = now
+        draw(*args)
+        self.drawn += 1
+        self.pending = None
+
+    def _sleep(self):
+        delay = self.slot - output.now()
+        if delay > 0:
+            output.sleep(delay)
+
+    def show(self, duration, draw, *args):
+        """Call draw(*args) for the next `duration` seconds of the sequence, or drop it when behind."""
+        now = self._claim()
+        self.frames += 1
+        end = self.slot + duration
+        if now < end and (self.last_drawn is None or now - self.last_drawn >= self.interval):
+            self._draw(draw, args, now)
+        else:
+            self.pending = (draw, args)
+        self.slot = end
+        self._sleep()
+
+    def pause(self, duration):
+        """Hold the current picture for `duration` seconds of the sequence."""
+        now = self._claim()
+        if self.pending:
+            self._draw(*self.pending, now)
+        self.slot += duration
+        self._sleep()
+
+    def finish(self) -> FrameStats:
+        """Draw any dropped last frame and return how the sequence went."""
+        if self.pending:
+            self._draw(*self.pending, output.now())
+        seconds = 0.0 if self.started is None else output.now() - self.started
+        return FrameStats(self.frames, self.drawn, self.frames - self.drawn, seconds, self.drawn / seconds if seconds else 0.0)
 
 # --------------------
 # Main animation loop
@@ -229,71 +691,58 @@ def render_frame_padded(lines, fire_cols=0, flame_colors=None, shake=0, extra_li
 def animate_hit(count):
     cols, rows = get_term_size()
     if rows < len(DRAGON_BASE) + 4 or cols < 60:
-        sys.stdout.write("Please enlarge the terminal (>=60 cols, more recommended) and re-run.\n")
+        output.write("Please enlarge the terminal (>=60 cols, more recommended) and re-run.\n")
         return
 
-    sys.stdout.write(HIDE_CURSOR)
-    sys.stdout.write(CLEAR_SCREEN + CURSOR_HOME)
-    sys.stdout.flush()
+    output.write(HIDE_CURSOR)
+    output.write(CLEAR_SCREEN + CURSOR_HOME)
+    output.flush()
+    screen = Screen()
+    clock = FrameClock()
 
     for _ in range(count):
         # 1) Idle breathing
-        idle_time = random.uniform(1.8, 5)
-        start = time.time()
+        idle_time = rng.uniform(1.8, 5)
+        start = clock.elapsed
         phase = 0
-        while time.time() - start < idle_time:
+        while clock.elapsed - start < idle_time:
             frame_lines = dragon_frame(idle_phase=phase, mouth_open=0, eye_fierce=False)
-            out = render_frame_padded(frame_lines, fire_cols=0, shake=0, extra_line=colored("------   (dragon idle)", DARK_GRAY))
-            sys.stdout.write(out)
-            sys.stdout.flush()
-            time.sleep(0.45)
+            clock.show(0.45, screen.draw, compose_frame(frame_lines, fire_cols=0, shake=0, extra_line=colored("------   (dragon idle)", DARK_GRAY)))
             phase += 1
 
         # tension pause
         frame_lines = dragon_frame(idle_phase=phase, mouth_open=1, eye_fierce=True)
-        out = render_frame_padded(frame_lines, fire_cols=0, shake=0, extra_line=colored("...", DARK_GRAY))
-        sys.stdout.write(out)
-        sys.stdout.flush()
-        time.sleep(2)
+        clock.show(2, screen.draw, compose_frame(frame_lines, fire_cols=0, shake=0, extra_line=colored("...", DARK_GRAY)))
 
         # 3) Roar buildup
         roar_build_steps = 6
         for step in range(roar_build_steps):
             mouth_open = 1 if step < roar_build_steps - 2 else 2
             frame_lines = dragon_frame(idle_phase=phase, mouth_open=mouth_open, eye_fierce=True)
-            shake = random.randint(0, min(3, step))
+            shake = rng.randint(0, min(3, step))
             text = random_roar_text(base="ra", intensity=4 + step * 2)
             text_color = BOLD + (RED if step > roar_build_steps // 2 else MAGENTA)
-            out = render_frame_padded(frame_lines, fire_cols=0, shake=shake, extra_line=colored(text, text_color))
-            sys.stdout.write(out)
-            sys.stdout.flush()
-            time.sleep(0.11)
+            clock.show(0.11, screen.draw, compose_frame(frame_lines, fire_cols=0, shake=shake, extra_line=colored(text, text_color)))
             phase += 1
 
         # 4) Big jumpscare roar + expanding fire
         cols, _ = get_term_size()
-        dragon_width = max(len(strip_ansi(l)) for l in DRAGON_BASE)
+        dragon_width = DRAGON_WIDTH
         max_fire_len = max(8, min(max(1, cols - dragon_width - 4), 70))
         flame_colors = [YELLOW, ORANGE, RED, MAGENTA]
 
         for length in range(0, max_fire_len + 1):
             frame_lines = dragon_frame(idle_phase=phase, mouth_open=2, eye_fierce=True)
-            shake = max(0, random.randint(-2, 2) + 2)
+            shake = max(0, rng.randint(-2, 2) + 2)
             roar_text = " " + random_roar_text(base="RA", intensity=6 + (length // 3))
             text_color = BOLD + (RED if length > max_fire_len * 0.45 else ORANGE)
-            out = render_frame_padded(frame_lines, fire_cols=length, flame_colors=flame_colors, shake=shake, extra_line=colored(roar_text, text_color))
-            sys.stdout.write(out)
-            sys.stdout.flush()
-            time.sleep(max(0.03, 0.14 - (length * 0.0025)))
+            clock.show(max(0.03, 0.14 - (length * 0.0025)), screen.draw, compose_frame(frame_lines, fire_cols=length, flame_colors=flame_colors, shake=shake, extra_line=colored(roar_text, text_color)))
             phase += 1
 
         # sustain full blast with flicker
         for sustain in range(24):
             frame_lines = dragon_frame(idle_phase=phase, mouth_open=2, eye_fierce=True)
-            out = render_frame_padded(frame_lines, fire_cols=max_fire_len, flame_colors=flame_colors, shake=random.randint(0, 3), extra_line=colored(random_roar_text(base="RA", intensity=12), BOLD + RED))
-            sys.stdout.write(out)
-            sys.stdout.flush()
-            time.sleep(0.02)
+            clock.show(0.02, screen.draw, compose_frame(frame_lines, fire_cols=max_fire_len, flame_colors=flame_colors, shake=rng.randint(0, 3), extra_line=colored(random_roar_text(base="RA", intensity=12), BOLD + RED)))
             phase += 1
 
         # 5) Smoke + cooldown fade
@@ -301,18 +750,14 @@ def animate_hit(count):
             fade_len = int(max_fire_len * (1.0 - (fade / 12.0)))
             smoke_colors = [DARK_GRAY, DARK_GRAY, MAGENTA]
             frame_lines = dragon_frame(idle_phase=phase, mouth_open=1 if fade < 8 else 0, eye_fierce=False)
-            out = render_frame_padded(frame_lines, fire_cols=fade_len, flame_colors=smoke_colors, shake=0, extra_line=colored("(smoke)...", DARK_GRAY))
-            sys.stdout.write(out)
-            sys.stdout.flush()
-            time.sleep(0.15)
+            clock.show(0.15, screen.draw, compose_frame(frame_lines, fire_cols=fade_len, flame_colors=smoke_colors, shake=0, extra_line=colored("(smoke)...", DARK_GRAY)))
             phase += 1
 
         # short cooldown idle
         frame_lines = dragon_frame(idle_phase=phase, mouth_open=0, eye_fierce=False)
-        out = render_frame_padded(frame_lines, fire_cols=0, shake=0, extra_line=colored("------   (dragon catches breath)", DARK_GRAY))
-        sys.stdout.write(out)
-        sys.stdout.flush()
-        time.sleep(1.2)
+        clock.show(1.2, screen.draw, compose_frame(frame_lines, fire_cols=0, shake=0, extra_line=colored("------   (dragon catches breath)", DARK_GRAY)))
+
+    return clock.finish()
 
 # --------------------
 # New animation functions
@@ -320,95 +765,96 @@ def animate_hit(count):
 def animate_emerge_from_binary():
     cols, rows = get_term_size()
     if rows < len(DRAGON_BASE) + 4 or cols < 60:
-        sys.stdout.write("Please enlarge the terminal (>=60 cols, more recommended) and re-run.\n")
+        output.write("Please enlarge the terminal (>=60 cols, more recommended) and re-run.\n")
         return
 
-    sys.stdout.write(HIDE_CURSOR)
-    sys.stdout.write(CLEAR_SCREEN + CURSOR_HOME)
-    sys.stdout.flush()
+    output.write(HIDE_CURSOR)
+    output.write(CLEAR_SCREEN + CURSOR_HOME)
+    output.flush()
+
+    clock = FrameClock()
 
     # Initial binary screen animation
+    void = Framebuffer(cols, rows)
     for _ in range(10):
-        binary_lines = []
-        for _ in range(rows):
-            line = ''.join(random.choice('01') for _ in range(cols))
-            binary_lines.append(colored(line, DARK_GRAY))
-        out = CURSOR_HOME + '\n'.join(binary_lines)
-        sys.stdout.write(out)
-        sys.stdout.flush()
-        time.sleep(0.05)
+        void.fill_binary()
+        clock.show(0.05, void.write_all, DARK_GRAY)
+
+    # Everything above the status line, the last row is the caption
+    fb = Framebuffer(cols, rows - 1)
+    status = rows
 
     # Prepare for reveal
-    dh = len(DRAGON_BASE)
-    dw = max(len(l) for l in DRAGON_BASE)
-    padded_dragon = [l.ljust(dw) for l in DRAGON_BASE]
+    dh = min(len(DRAGON_BASE), fb.rows)
+    dw = min(DRAGON_WIDTH, cols)
     row_start = 0
     col_start = 0
-
-    # Initialize grid with binary
-    grid = [[random.choice('01') for _ in range(cols)] for _ in range(rows)]
-
-    # Positions to reveal (dragon area)
-    reveal_positions = [(dr, dc) for dr in range(dh) for dc in range(dw) if row_start + dr < rows and col_start + dc < cols]
-    random.shuffle(reveal_positions)
+    target = bytearray(b" " * len(fb.buf))
+    for dr in range(dh):
+        line = DRAGON_BASE[dr].ljust(DRAGON_WIDTH)[:dw].encode()
+        at = (row_start + dr) * cols + col_start
+        target[at:at + dw] = line
+
+    # Positions to reveal (dragon area) and to fade (everything else), shuffled once
+    dragon_area = [(row_start + dr) * cols + col_start + dc for dr in range(dh) for dc in range(dw)]
+    in_dragon = bytearray(len(fb.buf))
+    for i in dragon_area:
+        in_dragon[i] = 1
+    non_dragon_positions = [i for i in range(len(fb.buf)) if not in_dragon[i]]
+    rng.shuffle(dragon_area)
+    rng.shuffle(non_dragon_positions)
+
+    # Fresh binary behind the reveal
+    fb.fill_binary()
+    fb.write_all()
+    fb.write_at(status, colored("Dragon emerging from the digital void...", DARK_GRAY))
 
     num_steps = 100
-    per_step = len(reveal_positions) // num_steps if num_steps > 0 else 0
+    per_step = len(dragon_area) // num_steps if num_steps > 0 else 0
 
     for step in range(num_steps):
         start_idx = step * per_step
-        end_idx = len(reveal_positions) if step == num_steps - 1 else (step + 1) * per_step
-        for i in range(start_idx, end_idx):
-            dr, dc = reveal_positions[i]
-            grid[row_start + dr][col_start + dc] = padded_dragon[dr][dc]
-
-        # Build and render frame
-        frame_lines = [''.join(grid[r]) for r in range(rows - 1)]
-        extra_line = colored("Dragon emerging from the digital void...", DARK_GRAY)
-        extra_padded = extra_line + ' ' * (cols - len(strip_ansi(extra_line)))
-        out = CURSOR_HOME + '\n'.join(frame_lines) + '\n' + extra_padded
-        sys.stdout.write(out)
-        sys.stdout.flush()
-        time.sleep(0.03)
+        end_idx = len(dragon_area) if step == num_steps - 1 else (step + 1) * per_step
+        changed = dragon_area[start_idx:end_idx]
+        for i in changed:
+            fb.buf[i] = target[i]
+        fb.dirty.extend(changed)
+        clock.show(0.03, fb.write_dirty)
 
     # Fade out non-dragon binary
-    non_dragon_positions = [(r, c) for r in range(rows) for c in range(cols) if not (row_start <= r < row_start + dh and col_start <= c < col_start + dw)]
-    random.shuffle(non_dragon_positions)
+    fb.write_at(status, colored("Digital void fading...", DARK_GRAY))
     num_fade_steps = 50
     per_fade_step = len(non_dragon_positions) // num_fade_steps if num_fade_steps > 0 else 0
 
     for step in range(num_fade_steps):
         start_idx = step * per_fade_step
         end_idx = len(non_dragon_positions) if step == num_fade_steps - 1 else (step + 1) * per_fade_step
-        for i in range(start_idx, end_idx):
-            r, c = non_dragon_positions[i]
-            grid[r][c] = ' '
-
-        # Build and render frame
-        frame_lines = [''.join(grid[r]) for r in range(rows - 1)]
-        extra_line = colored("Digital void fading...", DARK_GRAY)
-        extra_padded = extra_line + ' ' * (cols - len(strip_ansi(extra_line)))
-        out = CURSOR_HOME + '\n'.join(frame_lines) + '\n' + extra_padded
-        sys.stdout.write(out)
-        sys.stdout.flush()
-        time.sleep(0.03)
-
-    time.sleep(1)
-    sys.stdout.write(SHOW_CURSOR)
+        changed = non_dragon_positions[start_idx:end_idx]
+        for i in changed:
+            fb.buf[i] = 32  # space
+        fb.dirty.extend(changed)
+        clock.show(0.03, fb.write_dirty)
+
+    clock.pause(1)
+    output.write(SHOW_CURSOR)
+    output.flush()
+    return clock.finish()
 
 def animate_dodge_sword():
     cols, rows = get_term_size()
     if rows < len(DRAGON_BASE) + 4 or cols < 60:
-        sys.stdout.write("Please enlarge the terminal (>=60 cols, more recommended) and re-run.\n")
+        output.write("Please enlarge the terminal (>=60 cols, more recommended) and re-run.\n")
         return
 
-    sys.stdout.write(HIDE_CURSOR)
-    sys.stdout.write(CLEAR_SCREEN + CURSOR_HOME)
-    sys.stdout.flush()
+    output.write(HIDE_CURSOR)
+    output.write(CLEAR_SCREEN + CURSOR_HOME)
+    output.flush()
+    screen = Screen()
+    clock = FrameClock()
 
     sword_row_offset = 6  # Align with dragon's head
     sword_color = BOLD + RED
-    dragon_width = max(len(strip_ansi(l)) for l in DRAGON_BASE)
+    dragon_width = DRAGON_WIDTH
     start_pos = cols - max(len(l) for l in SWORD_BASE) - 5
     end_pos = dragon_width + 5
     steps = 30
@@ -423,38 +869,36 @@ def animate_dodge_sword():
             shift_left = min(max_shift, shift_left + (max_shift // 5))
 
         frame_lines = dragon_frame(eye_fierce=True, shift_left=shift_left)
-        current_dragon_width = max(len(strip_ansi(l)) for l in frame_lines)
+        current_dragon_width = frame_width(frame_lines)
         sword_p = pos if pos >= current_dragon_width else None
-        out = render_frame_padded(frame_lines, fire_cols=0, shake=0, extra_line=colored("Dodging the sword!", YELLOW), sword_pos=sword_p, sword_row_offset=sword_row_offset, sword_color=sword_color, sword_lines=SWORD_BASE)
-        sys.stdout.write(out)
-        sys.stdout.flush()
-        time.sleep(0.1)
+        clock.show(0.1, screen.draw, compose_frame(frame_lines, fire_cols=0, shake=0, extra_line=colored("Dodging the sword!", YELLOW), sword_pos=sword_p, sword_row_offset=sword_row_offset, sword_color=sword_color, sword_lines=SWORD_BASE))
         pos -= step_delta
 
     # Return to normal position
     for _ in range(5):
         shift_left = max(0, shift_left - (max_shift // 5))
         frame_lines = dragon_frame(shift_left=shift_left)
-        out = render_frame_padded(frame_lines, fire_cols=0, shake=0, extra_line=colored("Safe!", GREEN))
-        sys.stdout.write(out)
-        sys.stdout.flush()
-        time.sleep(0.1)
+        clock.show(0.1, screen.draw, compose_frame(frame_lines, fire_cols=0, shake=0, extra_line=colored("Safe!", GREEN)))
 
-    sys.stdout.write(SHOW_CURSOR)
+    output.write(SHOW_CURSOR)
+    output.flush()
+    return clock.finish()
 
 def animate_dodge_and_counter_sword():
     cols, rows = get_term_size()
     if rows < len(DRAGON_BASE) + 4 or cols < 60:
-        sys.stdout.write("Please enlarge the terminal (>=60 cols, more recommended) and re-run.\n")
+        output.write("Please enlarge the terminal (>=60 cols, more recommended) and re-run.\n")
         return
 
-    sys.stdout.write(HIDE_CURSOR)
-    sys.stdout.write(CLEAR_SCREEN + CURSOR_HOME)
-    sys.stdout.flush()
+    output.write(HIDE_CURSOR)
+    output.write(CLEAR_SCREEN + CURSOR_HOME)
+    output.flush()
+    screen = Screen()
+    clock = FrameClock()
 
     sword_row_offset = 6  # Align with dragon's head
     sword_color = BOLD + RED
-    dragon_width = max(len(strip_ansi(l)) for l in DRAGON_BASE)
+    dragon_width = DRAGON_WIDTH
     start_pos = cols - max(len(l) for l in SWORD_BASE) - 5
     end_pos = dragon_width + 5
     steps = 30
@@ -469,12 +913,9 @@ def animate_dodge_and_counter_sword():
             shift_left = min(max_shift, shift_left + (max_shift // 5))
 
         frame_lines = dragon_frame(eye_fierce=True, shift_left=shift_left)
-        current_dragon_width = max(len(strip_ansi(l)) for l in frame_lines)
+        current_dragon_width = frame_width(frame_lines)
         sword_p = pos if pos >= current_dragon_width else None
-        out = render_frame_padded(frame_lines, fire_cols=0, shake=0, extra_line=colored("Dodging and preparing counter!", YELLOW), sword_pos=sword_p, sword_row_offset=sword_row_offset, sword_color=sword_color, sword_lines=SWORD_BASE)
-        sys.stdout.write(out)
-        sys.stdout.flush()
-        time.sleep(0.1)
+        clock.show(0.1, screen.draw, compose_frame(frame_lines, fire_cols=0, shake=0, extra_line=colored("Dodging and preparing counter!", YELLOW), sword_pos=sword_p, sword_row_offset=sword_row_offset, sword_color=sword_color, sword_lines=SWORD_BASE))
         pos -= step_delta
 
     # Counter with fire
@@ -482,37 +923,35 @@ def animate_dodge_and_counter_sword():
     max_fire_len = max(8, min(cols - dragon_width - 4, 70))
     for length in range(0, max_fire_len + 1):
         frame_lines = dragon_frame(mouth_open=2, eye_fierce=True, shift_left=shift_left)
-        current_dragon_width = max(len(strip_ansi(l)) for l in frame_lines)
+        current_dragon_width = frame_width(frame_lines)
         sword_p = end_pos if end_pos >= current_dragon_width + length else None  # disappear when fire reaches
-        out = render_frame_padded(frame_lines, fire_cols=length, flame_colors=flame_colors, shake=random.randint(0, 3), extra_line=colored("Counter fire!", RED), sword_pos=sword_p, sword_row_offset=sword_row_offset, sword_color=sword_color, sword_lines=SWORD_BASE)
-        sys.stdout.write(out)
-        sys.stdout.flush()
-        time.sleep(0.05)
+        clock.show(0.05, screen.draw, compose_frame(frame_lines, fire_cols=length, flame_colors=flame_colors, shake=rng.randint(0, 3), extra_line=colored("Counter fire!", RED), sword_pos=sword_p, sword_row_offset=sword_row_offset, sword_color=sword_color, sword_lines=SWORD_BASE))
 
     # Return to normal
     for _ in range(5):
         shift_left = max(0, shift_left - (max_shift // 5))
         frame_lines = dragon_frame(shift_left=shift_left)
-        out = render_frame_padded(frame_lines, fire_cols=0, shake=0, extra_line=colored("Victory!", GREEN))
-        sys.stdout.write(out)
-        sys.stdout.flush()
-        time.sleep(0.1)
+        clock.show(0.1, screen.draw, compose_frame(frame_lines, fire_cols=0, shake=0, extra_line=colored("Victory!", GREEN)))
 
-    sys.stdout.write(SHOW_CURSOR)
+    output.write(SHOW_CURSOR)
+    output.flush()
+    return clock.finish()
 
 def animate_get_hit_by_sword():
     cols, rows = get_term_size()
     if rows < len(DRAGON_BASE) + 4 or cols < 60:
-        sys.stdout.write("Please enlarge the terminal (>=60 cols, more recommended) and re-run.\n")
+        output.write("Please enlarge the terminal (>=60 cols, more recommended) and re-run.\n")
         return
 
-    sys.stdout.write(HIDE_CURSOR)
-    sys.stdout.write(CLEAR_SCREEN + CURSOR_HOME)
-    sys.stdout.flush()
+    output.write(HIDE_CURSOR)
+    output.write(CLEAR_SCREEN + CURSOR_HOME)
+    output.flush()
+    screen = Screen()
+    clock = FrameClock()
 
     sword_row_offset = 6  # Align with dragon's head
     sword_color = BOLD + RED
-    dragon_width = max(len(strip_ansi(l)) for l in DRAGON_BASE)
+    dragon_width = DRAGON_WIDTH
     start_pos = cols - max(len(l) for l in SWORD_BASE) - 5
     end_pos = dragon_width - 10  # allow overlap for hit
     steps = 30
@@ -525,7 +964,7 @@ def animate_get_hit_by_sword():
     for step in range(steps):
         if step > hit_step:
             hurt = True
-            shake = random.randint(5, 10)
+            shake = rng.randint(5, 10)
             sword_p = None  # hide sword on impact
         else:
             hurt = False
@@ -533,39 +972,34 @@ def animate_get_hit_by_sword():
             sword_p = pos if pos >= dragon_width else None
 
         frame_lines = dragon_frame(eye_fierce=True, hurt=hurt)
-        out = render_frame_padded(frame_lines, fire_cols=0, shake=shake, extra_line=colored("Getting hit!", RED), sword_pos=sword_p, sword_row_offset=sword_row_offset, sword_color=sword_color, sword_lines=SWORD_BASE)
-        sys.stdout.write(out)
-        sys.stdout.flush()
-        time.sleep(0.1)
+        clock.show(0.1, screen.draw, compose_frame(frame_lines, fire_cols=0, shake=shake, extra_line=colored("Getting hit!", RED), sword_pos=sword_p, sword_row_offset=sword_row_offset, sword_color=sword_color, sword_lines=SWORD_BASE))
         pos -= step_delta
 
     # Recovery
     for _ in range(10):
         shake = max(0, shake - 1)
         frame_lines = dragon_frame(hurt=True if _ < 5 else False, mouth_open=0)
-        out = render_frame_padded(frame_lines, fire_cols=0, shake=shake, extra_line=colored("Ouch!", RED))
-        sys.stdout.write(out)
-        sys.stdout.flush()
-        time.sleep(0.15)
+        clock.show(0.15, screen.draw, compose_frame(frame_lines, fire_cols=0, shake=shake, extra_line=colored("Ouch!", RED)))
 
-    sys.stdout.write(SHOW_CURSOR)
+    output.write(SHOW_CURSOR)
+    output.flush()
+    return clock.finish()
 
 def animate_fumble_fire():
     cols, rows = get_term_size()
     if rows < len(DRAGON_BASE) + 4 or cols < 60:
-        sys.stdout.write("Please enlarge the terminal (>=60 cols, more recommended) and re-run.\n")
+        output.write("Please enlarge the terminal (>=60 cols, more recommended) and re-run.\n")
         return
 
-    sys.stdout.write(HIDE_CURSOR)
-    sys.stdout.write(CLEAR_SCREEN + CURSOR_HOME)
-    sys.stdout.flush()
+    output.write(HIDE_CURSOR)
+    output.write(CLEAR_SCREEN + CURSOR_HOME)
+    output.flush()
+    screen = Screen()
+    clock = FrameClock()
 
     # Idle start
     frame_lines = dragon_frame(mouth_open=0, eye_fierce=False)
-    out = render_frame_padded(frame_lines, fire_cols=0, shake=0, extra_line=colored("Preparing fire...", DARK_GRAY))
-    sys.stdout.write(out)
-    sys.stdout.flush()
-    time.sleep(1)
+    clock.show(1, screen.draw, compose_frame(frame_lines, fire_cols=0, shake=0, extra_line=colored("Preparing fire...", DARK_GRAY)))
 
     # Buildup
     roar_build_steps = 6
@@ -573,45 +1007,35 @@ def animate_fumble_fire():
     for step in range(roar_build_steps):
         mouth_open = 1 if step < roar_build_steps - 2 else 2
         frame_lines = dragon_frame(idle_phase=phase, mouth_open=mouth_open, eye_fierce=True)
-        shake = random.randint(0, min(3, step))
+        shake = rng.randint(0, min(3, step))
         text = random_roar_text(base="ra", intensity=4 + step * 2)
         text_color = BOLD + (RED if step > roar_build_steps // 2 else MAGENTA)
-        out = render_frame_padded(frame_lines, fire_cols=0, shake=shake, extra_line=colored(text, text_color))
-        sys.stdout.write(out)
-        sys.stdout.flush()
-        time.sleep(0.11)
+        clock.show(0.11, screen.draw, compose_frame(frame_lines, fire_cols=0, shake=shake, extra_line=colored(text, text_color)))
         phase += 1
 
     # Fumble fire: expand a bit, then fizzle
-    dragon_width = max(len(strip_ansi(l)) for l in DRAGON_BASE)
+    dragon_width = DRAGON_WIDTH
     max_fire_len = 10  # small max
     flame_colors = [YELLOW, ORANGE, RED, MAGENTA]
     for length in range(0, max_fire_len + 1):
         frame_lines = dragon_frame(idle_phase=phase, mouth_open=2, eye_fierce=True)
-        out = render_frame_padded(frame_lines, fire_cols=length, flame_colors=flame_colors, shake=random.randint(0, 3), extra_line=colored("Firing... oh no!", RED))
-        sys.stdout.write(out)
-        sys.stdout.flush()
-        time.sleep(0.05)
+        clock.show(0.05, screen.draw, compose_frame(frame_lines, fire_cols=length, flame_colors=flame_colors, shake=rng.randint(0, 3), extra_line=colored("Firing... oh no!", RED)))
         phase += 1
 
     # Fizzle: reduce with smoke
     for fade in range(max_fire_len, 0, -1):
         smoke_colors = [DARK_GRAY, DARK_GRAY, MAGENTA]
         frame_lines = dragon_frame(idle_phase=phase, mouth_open=1, eye_fierce=False)
-        out = render_frame_padded(frame_lines, fire_cols=fade, flame_colors=smoke_colors, shake=0, extra_line=colored("Fumbled! (cough)", DARK_GRAY))
-        sys.stdout.write(out)
-        sys.stdout.flush()
-        time.sleep(0.1)
+        clock.show(0.1, screen.draw, compose_frame(frame_lines, fire_cols=fade, flame_colors=smoke_colors, shake=0, extra_line=colored("Fumbled! (cough)", DARK_GRAY)))
         phase += 1
 
     # Cooldown
     frame_lines = dragon_frame(mouth_open=0, eye_fierce=False)
-    out = render_frame_padded(frame_lines, fire_cols=0, shake=0, extra_line=colored("------   (dragon embarrassed)", DARK_GRAY))
-    sys.stdout.write(out)
-    sys.stdout.flush()
-    time.sleep(1.5)
+    clock.show(1.5, screen.draw, compose_frame(frame_lines, fire_cols=0, shake=0, extra_line=colored("------   (dragon embarrassed)", DARK_GRAY)))
 
-    sys.stdout.write(SHOW_CURSOR)
+    output.write(SHOW_CURSOR)
+    output.flush()
+    return clock.finish()
 
 def animate_all():
     animate_emerge_from_binary()
@@ -0,0 +1,177 @@
+"""
+Item effects, looked up by name in one registry instead of an if/elif chain.
+
+Most items are plain numbers (HP healed, skill points, a weapon granted) and
+are described by an ItemEffect. The few that do something unusual carry an
+`apply` function. use() applies N copies of an item in one step and returns
+short summary messages, so using ten thousand potions is one dict update and
+one line of output instead of ten thousand.
+
+Interactive items (the Secret Map) are handled by rpg.use_item itself.
+"""
+
+import math
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import content
+import randomness
+
+loot_rng = randomness.stream("loot")
+
+# Message kinds, rendered green / yellow / red by the game
+OK = "ok"
+NOTE = "note"
+FAIL = "fail"
+
+@dataclass(frozen=True)
+class ItemEffect:
+    heal: int = 0                               # HP per use, capped at max_hp
+    stats: Tuple[Tuple[str, float], ...] = ()   # skill deltas per use
+    weapon: Tuple = ()                          # (name, min, max) granted once
+    one_shot: bool = False                      # works once per game, recorded in used_items
+    requires: str = ""                          # used_items entry needed before this works
+    apply: Optional[Callable] = None            # apply(game, n, rng) -> messages, for anything else
+
+# ----------------------
+# Special effects
+# ----------------------
+def _learn_spells(game, n, rng):
+    spells = content.load("spells")
+    learned = [list(s) for s in rng.choices(spells["beginners_scroll"], weights=spells["beginners_scroll_weights"], k=n)]
+    game["spells"].extend(learned)
+    if n == 1:
+        return [(OK, f"You learned a new spell: {learned[0][0]}!"), (NOTE, "The Scroll was used up")]
+    counts = ", ".join(f"{name} x{c}" for name, c in Counter(s[0] for s in learned).items())
+    return [(OK, f"You learned {n} spells: {counts}!"), (NOTE, "The Scrolls were used up")]
+
+def _mystic_cloak(game, n, rng):
+    for w in game["weapons"]:
+        w[1] += 50
+        w[2] += 50
+    game["max_hp"] += 50
+    game["hp"] = game["max_hp"]
+    weapons = ", ".join(f"{w[0]}: {w[1]}-{w[2]}" for w in game["weapons"])
+    return [(OK, "You have used the Mystic Cloak and buffed all your weapons by 50 dmg and your HP, also regenerated to max."),
+            (OK, f"HP: {game['hp']}/{game['max_hp']}, weapons: {weapons}")]
+
+def _doubled(value, n):
+    """`value` doubled `n` times. Floats end up at inf like repeated * 2 would, rather than raising OverflowError."""
+    if isinstance(value, float):
+        try:
+            return math.ldexp(value, n)
+        except OverflowError:
+            return math.copysign(math.inf, value)
+    return value * 2**n
+
+def _infinity_buff(game, n, rng):
+    for _ in range(n):
+        game["max_hp"] += round(game["max_hp"]*0.1)
+    game["skill_set"] = {k: _doubled(v, n) for k, v in game["skill_set"].items()}
+    game["used_items"].extend(["Infinity Buff"] * n)
+    skills = ", ".join(f"{k}: {v}" for k, v in game["skill_set"].items())
+    return [(OK, f"You have used {_label('Infinity Buff', n)}, your max HP is now {game['max_hp']} and your skills are {skills}.")]
+
+def _infinity_heal(game, n, rng):
+    game["max_hp"] = _doubled(game["max_hp"], n)
+    game["hp"] = game["max_hp"]
+    return [(OK, f"You have used {_label('Infinity Heal', n)} and restored your HP to max ({game['max_hp']}).")]
+
+# ----------------------
+# Registry
+# ----------------------
+ITEMS: Dict[str, ItemEffect] = {
+    "Small Health Potion": ItemEffect(heal=20),
+    "Medium Health Potion": ItemEffect(heal=50),
+    "Large Health Potion": ItemEffect(heal=90),
+    "Elite Health Potion": ItemEffect(heal=150),
+    "Legendary Health Potion": ItemEffect(heal=200),
+    "Divine Health Potion": ItemEffect(heal=300),
+    "Wooden Shield": ItemEffect(stats=(("defence", 0.2),)),
+    "Assassin's Cloak": ItemEffect(stats=(("agility", 5), ("accuracy", 5)), one_shot=True),
+    "Assassin Build Scroll": ItemEffect(stats=(("agility", 5), ("accuracy", 5)), weapon=("Assassin's Dagger", 100, 200),
+                                        one_shot=True, requires="Assassin's Cloak"),
+    "Beginner's Scroll": ItemEffect(apply=_learn_spells),
+    "Mystic Cloak": ItemEffect(one_shot=True, apply=_mystic_cloak),
+    "Infinity Buff": ItemEffect(apply=_infinity_buff),
+    "Infinity Heal": ItemEffect(apply=_infinity_heal),
+}
+
+# Heal per potion, best first
+POTIONS = dict(sorted(((name, e.heal) for name, e in ITEMS.items() if e.heal), key=lambda p: -p[1]))
+
+def _label(item, n):
+    return item if n == 1 else f"{n}x {item}"
+
+class Inventory(dict):
+    """Counted inventory, item name -> how many, in the order items were first picked up.
+
+    Items whose count drops to zero are removed, so `item in inventory` and
+    len() only see what the player is actually carrying. Saves as a plain
+    {item: count} JSON object.
+    """
+    def add(self, item, n=1):
+        if n > 0:
+            self[item] = self.get(item, 0) + n
+
+    def remove(self, item, n=1):
+        """Take `n` of `item` out, ValueError if there are not that many (like list.remove)."""
+        held = self.get(item, 0)
+        if held < n:
+            raise ValueError(f"only {held} {item} in inventory, cannot remove {n}")
+        if held == n:
+            del self[item]
+        else:
+            self[item] = held - n
+
+    def count(self, item):
+        return self.get(item, 0)
+
+    @classmethod
+    def load(cls, data):
+        """Inventory from a save's {item: count} object (older list saves are migrated by schema.migrate)."""
+        inventory = cls()
+        for item, n in data.items():
+            inventory.add(item, n)
+        return inventory
+
+def use(game, item, count=1, rng=loot_rng) -> Tuple[int, List[Tuple[str, str]]]:
+    """Use up to `count` of `item` from the inventory as one combined effect.
+
+    Returns how many were used up and a list of (kind, text) messages.
+    One-shot items are used at most once.
+    """
+    effect = ITEMS.get(item)
+    if effect is None:
+        return 0, [(FAIL, f"Nothing happens when you use the {item}.")]
+    n = min(count, game["inventory"].count(item))
+    if n <= 0:
+        return 0, [(FAIL, f"You don't have any {item}!")]
+    if effect.requires and effect.requires not in game["used_items"]:
+        return 0, [(FAIL, f"You need to use the {effect.requires} first!")]
+    if effect.one_shot:
+        if item in game["used_items"]:
+            return 0, [(FAIL, f"You have already used the {item}.")]
+        n = 1
+
+    if effect.apply:
+        messages = effect.apply(game, n, rng)
+    else:
+        parts = []
+        if effect.heal:
+            game["hp"] = min(game["hp"] + effect.heal * n, game["max_hp"])
+            parts.append(f"your HP is now {game['hp']}")
+        for skill, delta in effect.stats:
+            game["skill_set"][skill] += delta * n
+            parts.append(f"your {skill} is now {game['skill_set'][skill]}")
+        if effect.weapon:
+            game["weapons"].append(list(effect.weapon))
+            parts.append(f"you got a new weapon: {effect.weapon[0]} ({effect.weapon[1]}-{effect.weapon[2]})")
+        summary = ", ".join(parts)
+        messages = [(OK, f"You used {_label(item, n)}! {summary[0].upper()}{summary[1:]}.")]
+
+    if effect.one_shot:
+        game["used_items"].append(item)
+    game["inventory"].remove(item, n)
+    return n, messages
@@ -0,0 +1,50 @@
+"""
+Monster tables for random encounters, one tier per player level.
+
+The rows from data/monsters.json are compiled once at import into an
+immutable catalog: slotted MonsterTemplate objects per tier and per-tier
+chance tables searched with bisection. A fight gets its own lightweight Monster carrying the current
+HP, so the templates are never mutated and can be shared freely.
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Tuple
+
+import content
+
+# Monster rows (name, hp, damage, reward, chance, xp drop) per tier, from data/monsters.json
+MONSTERS = content.load("monsters")
+
+@dataclass(frozen=True, slots=True)
+class MonsterTemplate:
+    name: str
+    hp: int
+    damage: int
+    reward: int
+    chance: int     # cumulative encounter threshold for the 0-100 roll
+    xp: int
+
+class Monster:
+    """One monster in one fight."""
+    __slots__ = ("template", "hp")
+
+    def __init__(self, template: MonsterTemplate):
+        self.template = template
+        self.hp = template.hp
+
+TIERS: Tuple[Tuple[MonsterTemplate, ...], ...] = tuple(tuple(MonsterTemplate(*row) for row in tier) for tier in MONSTERS)
+_CHANCES = tuple(tuple(m.chance for m in tier) for tier in TIERS)
+
+def tier_index(level):
+    """Tier for a player level. There is no tier past level 23, those levels reuse the last one."""
+    return min(max(level, 1), len(TIERS)) - 1
+
+def encounter(level, roll) -> Tuple[MonsterTemplate, ...]:
+    """Every monster fought for an encounter roll, in order.
+
+    That is the monster the roll lands on and, as the encounter has always played, each
+    monster after it in the tier.
+    """
+    tier = tier_index(level)
+    return TIERS[tier][bisect_left(_CHANCES[tier], roll):]
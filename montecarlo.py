@@ -0,0 +1,187 @@
+"""
+Monte Carlo balance simulator for the monster tiers.
+
+Takes a player profile and plays huge batches of fights against every monster
+in a tier at once with NumPy arrays (damage rolls, hit masks and HP vectors),
+using the same thresholds as battle.py so the numbers match the real game
+within sampling error.
+
+Needs numpy (pip install numpy).
+
+Run: python3 montecarlo.py --level 3 --weapon 15 30 --fights 200000
+"""
+
+import argparse
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import numpy as np
+
+import battle
+import monsters
+
+# Fights played per array pass, keeps memory flat no matter how many are asked for
+CHUNK = 1 << 20
+
+# ----------------------
+# Data structures
+# ----------------------
+@dataclass(frozen=True)
+class PlayerProfile:
+    level: int
+    weapon_min: int
+    weapon_max: int
+    skill_set: Dict[str, float] = field(default_factory=lambda: {
+        "strength": 0,
+        "agility": 0,
+        "luck": 0,
+        "accuracy": 0,
+        "defence": 0
+    })
+    hp: int = 100
+
+    @classmethod
+    def from_game(cls, game):
+        weapon = game["weapons"][game["equipped"]]
+        return cls(game["level"], weapon[1], weapon[2], dict(game["skill_set"]), game["hp"])
+
+@dataclass(frozen=True)
+class MonsterStats:
+    name: str
+    pick_chance: float        # chance the encounter roll lands on this monster first
+    fights: int
+    win_rate: float
+    loss_rate: float          # the rest ran into max_turns
+    mean_turns_to_kill: float # over won fights only, nan if none were won
+    mean_hp_lost: float
+
+# ----------------------
+# Simulation
+# ----------------------
+def _setup_arrays(profile, templates):
+    """Stack one battle.BattleSetup per monster into per-monster NumPy columns."""
+    weapon = [None, profile.weapon_min, profile.weapon_max]
+    setups = [battle.make_setup(profile.level, weapon, profile.skill_set, m.name, m.damage) for m in templates]
+    names = ("dmg_min", "dmg_max", "mdmg_min", "mdmg_max", "mdmg_reduction",
+             "counter_min", "counter_max", "hit_chance", "attack_strike", "counter_strike")
+    return {n: np.array([getattr(s, n) for s in setups]) for n in names}
+
+def _play_chunk(gen, cols, monster_idx, monster_hp, player_hp, action, max_turns):
+    """Play len(monster_idx) fights side by side until every one of them ends.
+
+    Returns (player_hp, monster_hp, turns) arrays. Fights drop out of the
+    working set as soon as they finish so later turns only touch live ones.
+    """
+    n = len(monster_idx)
+    php = np.full(n, player_hp, dtype=np.int64)
+    mhp = monster_hp[monster_idx].astype(np.int64)
+    turns = np.zeros(n, dtype=np.int64)
+    active = np.arange(n)
+
+    dmg_min = cols["dmg_min"][0]
+    dmg_max = cols["dmg_max"][0]
+    reduction = cols["mdmg_reduction"][0]
+    hit_chance = cols["hit_chance"][0]
+    attack_strike = cols["attack_strike"][0]
+    counter_strike = cols["counter_strike"][0]
+
+    for _ in range(max_turns):
+        k = active.size
+        if k == 0:
+            break
+        m = monster_idx[active]
+
+        # Both sides roll every turn, whatever the action
+        dmg = gen.integers(dmg_min, dmg_max + 1, size=k)
+        mdmg = np.round(gen.integers(cols["mdmg_min"][m], cols["mdmg_max"][m] + 1) - reduction).astype(np.int64)
+
+        if action == "attack":
+            hit = gen.integers(0, 101, size=k) < hit_chance
+            mhp[active] -= np.where(hit, dmg, 0)
+            strike = (mhp[active] > 0) & (gen.integers(0, 101, size=k) < attack_strike)
+        else:
+            hit = gen.integers(0, 101, size=k) <= hit_chance
+            counter = gen.integers(cols["counter_min"][m], cols["counter_max"][m] + 1)
+            mhp[active] -= np.where(hit, counter, 0)
+            strike = ~hit & (mhp[active] > 0) & (gen.integers(0, 101, size=k) < counter_strike)
+        php[active] -= np.where(strike, mdmg, 0)
+
+        turns[active] += 1
+        active = active[(mhp[active] > 0) & (php[active] > 0)]
+
+    return php, mhp, turns
+
+def simulate_tier(profile: PlayerProfile, tier: int, fights: int = 100_000, action: str = "attack", seed=None, max_turns: int = 1000) -> List[MonsterStats]:
+    """Play `fights` fights against every monster of monsters.TIERS[tier].
+
+    `action` is the fixed policy, "attack" or "counter". Every fight starts at
+    profile.hp against a fresh monster.
+    """
+    if action not in ("attack", "counter"):
+        raise ValueError(f"Unsupported action for the vectorized simulator: {action}")
+
+    templates = monsters.TIERS[tier]
+    gen = np.random.default_rng(seed)
+    cols = _setup_arrays(profile, templates)
+    monster_hp = np.array([m.hp for m in templates])
+
+    wins = np.zeros(len(templates), dtype=np.int64)
+    losses = np.zeros(len(templates), dtype=np.int64)
+    kill_turns = np.zeros(len(templates), dtype=np.int64)
+    hp_lost = np.zeros(len(templates), dtype=np.int64)
+
+    # Round robin the monsters across the flat fight index so every chunk mixes the tier
+    total = fights * len(templates)
+    for start in range(0, total, CHUNK):
+        monster_idx = np.arange(start, min(start + CHUNK, total)) % len(templates)
+        php, mhp, turns = _play_chunk(gen, cols, monster_idx, monster_hp, profile.hp, action, max_turns)
+        won = mhp <= 0
+        lost = ~won & (php <= 0)
+        wins += np.bincount(monster_idx, weights=won, minlength=len(templates)).astype(np.int64)
+        losses += np.bincount(monster_idx, weights=lost, minlength=len(templates)).astype(np.int64)
+        kill_turns += np.bincount(monster_idx, weights=np.where(won, turns, 0), minlength=len(templates)).astype(np.int64)
+        hp_lost += np.bincount(monster_idx, weights=profile.hp - np.maximum(php, 0), minlength=len(templates)).astype(np.int64)
+
+    results = []
+    previous = -1
+    for i, m in enumerate(templates):
+        pick = max(0, min(m.chance, 100) - previous) / 101
+        previous = max(previous, min(m.chance, 100))
+        results.append(MonsterStats(
+            name=m.name,
+            pick_chance=pick,
+            fights=fights,
+            win_rate=wins[i] / fights,
+            loss_rate=losses[i] / fights,
+            mean_turns_to_kill=kill_turns[i] / wins[i] if wins[i] else float("nan"),
+            mean_hp_lost=hp_lost[i] / fights,
+        ))
+    return results
+
+def simulate_all(profile: PlayerProfile, fights: int = 100_000, action: str = "attack", seed=None) -> Dict[int, List[MonsterStats]]:
+    """simulate_tier over every tier, keyed by tier index."""
+    seeds = np.random.SeedSequence(seed).spawn(len(monsters.TIERS))
+    return {tier: simulate_tier(profile, tier, fights, action, seeds[tier]) for tier in range(len(monsters.TIERS))}
+
+def print_report(tier, results):
+    print(f"Tier {tier}")
+    print(f"  {'monster':<20} {'pick':>6} {'win':>7} {'loss':>7} {'turns':>7} {'hp lost':>9}")
+    for s in results:
+        print(f"  {s.name:<20} {s.pick_chance:>6.1%} {s.win_rate:>7.2%} {s.loss_rate:>7.2%} {s.mean_turns_to_kill:>7.2f} {s.mean_hp_lost:>9.1f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo fights against the monster tiers")
+    parser.add_argument("--level", type=int, default=1)
+    parser.add_argument("--hp", type=int, default=100)
+    parser.add_argument("--weapon", type=int, nargs=2, default=[5, 15], metavar=("MIN", "MAX"))
+    parser.add_argument("--skills", type=int, nargs=5, default=[0, 0, 0, 0, 0], metavar=("STR", "AGI", "LUCK", "ACC", "DEF"))
+    parser.add_argument("--tier", type=int, help="tier index to simulate, defaults to the one for --level")
+    parser.add_argument("--fights", type=int, default=100_000, help="fights per monster")
+    parser.add_argument("--action", choices=["attack", "counter"], default="attack")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    skills = dict(zip(["strength", "agility", "luck", "accuracy", "defence"], args.skills))
+    profile = PlayerProfile(args.level, args.weapon[0], args.weapon[1], skills, args.hp)
+    tier = monsters.tier_index(args.level) if args.tier is None else args.tier
+    print_report(tier, simulate_tier(profile, tier, args.fights, args.action, args.seed))
@@ -0,0 +1,264 @@
+"""
+Where the game's animation output goes.
+
+The dragon animations, typewriter and spinner write through this module
+instead of straight to sys.stdout, and take their time from it too. Swap
+the sink to change where frames end up:
+
+- StdoutSink (the default) writes to the terminal in real time.
+- CastSink records into an asciicast v2 file that play() (or asciinema)
+  replays at any speed. By default it renders on a virtual clock, so
+  recording a minute long animation takes well under a second.
+- NullSink throws the output away and counts it, also on a virtual clock.
+  That is the headless benchmark: frames, bytes and CPU time per animation
+  without a terminal.
+
+Run:
+    python3 output.py record dragon.cast emerge_from_binary
+    python3 output.py play dragon.cast --speed 2
+    python3 output.py bench --size 120x40
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+from typing import NamedTuple
+
+# ----------------------
+# Sinks
+# ----------------------
+class StdoutSink:
+    """The real terminal and the real clock."""
+    def write(self, data):
+        sys.stdout.write(data)
+
+    def flush(self):
+        sys.stdout.flush()
+
+    def now(self):
+        return time.monotonic()
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            time.sleep(seconds)
+
+class _VirtualClock:
+    """now() and sleep() on a clock that only moves when slept on, for output nobody watches live."""
+    def __init__(self):
+        self.time = 0.0
+
+    def now(self):
+        return self.time
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            self.time += seconds
+
+class NullSink(_VirtualClock):
+    """Discards everything written, counting writes, bytes and frames (flushes)."""
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+        self.bytes = 0
+        self.frames = 0
+
+    def write(self, data):
+        self.writes += 1
+        self.bytes += len(data.encode())
+
+    def flush(self):
+        self.frames += 1
+
+class CastSink(_VirtualClock):
+    """
+    Records output into an asciicast v2 file: a JSON header line, then one
+    [seconds, "o", data] line per flushed frame.
+
+    With `realtime` the recording runs on the wall clock and is also shown
+    on the terminal, otherwise it runs on a virtual clock as fast as the
+    frames can be rendered. close() (or leaving a `with` block) finishes
+    the file.
+    """
+    def __init__(self, path, width, height, realtime=False, title=None):
+        super().__init__()
+        self.realtime = realtime
+        self.buffer = []
+        self.file = open(path, "w", encoding="utf-8")
+        header = {"version": 2, "width": width, "height": height, "timestamp": int(time.time())}
+        if title:
+            header["title"] = title
+        self.file.write(json.dumps(header) + "\n")
+        self.started = time.monotonic()
+
+    def now(self):
+        return time.monotonic() - self.started if self.realtime else self.time
+
+    def sleep(self, seconds):
+        if self.realtime:
+            if seconds > 0:
+                time.sleep(seconds)
+        else:
+            super().sleep(seconds)
+
+    def write(self, data):
+        self.buffer.append(data)
+        if self.realtime:
+            sys.stdout.write(data)
+
+    def flush(self):
+        if self.buffer:
+            self.file.write(json.dumps([round(self.now(), 6), "o", "".join(self.buffer)]) + "\n")
+            self.buffer = []
+        if self.realtime:
+            sys.stdout.flush()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+sink = StdoutSink()
+
+def write(data):
+    sink.write(data)
+
+def flush():
+    sink.flush()
+
+def now():
+    return sink.now()
+
+def sleep(seconds):
+    sink.sleep(seconds)
+
+@contextlib.contextmanager
+def using(new_sink):
+    """Send all output to `new_sink` for the duration of the with block."""
+    global sink
+    previous, sink = sink, new_sink
+    try:
+        yield new_sink
+    finally:
+        sink = previous
+
+# ----------------------
+# Playback
+# ----------------------
+def play(path, speed=1.0, max_idle=None, out=None):
+    """Replay an asciicast v2 file, `speed` times as fast, pauses capped at `max_idle` seconds."""
+    out = out or sys.stdout
+    with open(path, encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("version") != 2:
+            raise ValueError(f"{path}: not an asciicast v2 file")
+        previous = 0.0
+        for line in f:
+            if not line.strip():
+                continue
+            at, kind, data = json.loads(line)
+            if kind != "o":
+                continue
+            pause = at - previous
+            if max_idle is not None:
+                pause = min(pause, max_idle)
+            if pause > 0:
+                time.sleep(pause / speed)
+            previous = at
+            out.write(data)
+            out.flush()
+
+# ----------------------
+# Headless benchmark
+# ----------------------
+class BenchResult(NamedTuple):
+    name: str
+    frames: int         # flushes, one per frame drawn
+    bytes: int
+    cpu: float          # CPU seconds spent rendering
+    seconds: float      # length of the sequence on its own timeline
+
+def bench(name, run):
+    """Run `run()` into a NullSink and measure it."""
+    with using(NullSink()) as null:
+        cpu = time.process_time()
+        run()
+        cpu = time.process_time() - cpu
+    return BenchResult(name, null.frames, null.bytes, cpu, null.time)
+
+def _animations():
+    """name -> zero argument callable for everything that can be recorded or benchmarked."""
+    import drago_animations
+    import rpg
+
+    runs = {
+        name[len("animate_"):]: getattr(drago_animations, name)
+        for name in dir(drago_animations)
+        if name.startswith("animate_") and name != "animate_all"
+    }
+    runs["hit"] = lambda: drago_animations.animate_hit(1)
+    runs["typewriter"] = lambda: rpg.typewriter("The dragon stirs beneath the mountain...", rpg.style.RED)
+    runs["spinner"] = lambda: rpg.spinner(2, 0.1)
+    return runs
+
+def _set_size(size):
+    import drago_animations
+
+    if size:
+        cols, rows = size.lower().split("x")
+        os.environ["COLUMNS"], os.environ["LINES"] = cols, rows
+        drago_animations.terminal.refresh()
+    return drago_animations.get_term_size()
+
+if __name__ == "__main__":
+    # The animations `import output`, make that this module rather than a second copy with its own sink
+    sys.modules.setdefault("output", sys.modules[__name__])
+
+    parser = argparse.ArgumentParser(description="Record, replay and benchmark the game's animations")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", help="record animations into an asciicast file")
+    record.add_argument("path")
+    record.add_argument("names", nargs="*", help="animations to record in order, all of them when empty")
+    record.add_argument("--realtime", action="store_true", help="record on the wall clock and show it while recording")
+    record.add_argument("--size", help="terminal size to render at, like 120x40")
+
+    player = commands.add_parser("play", help="replay an asciicast file")
+    player.add_argument("path")
+    player.add_argument("--speed", type=float, default=1.0)
+    player.add_argument("--max-idle", type=float, help="cap pauses at this many seconds")
+
+    benchmark = commands.add_parser("bench", help="render animations headless and report their cost")
+    benchmark.add_argument("names", nargs="*", help="animations to run, all of them when empty")
+    benchmark.add_argument("--size", help="terminal size to render at, like 120x40")
+
+    args = parser.parse_args()
+    if args.command == "play":
+        play(args.path, args.speed, args.max_idle)
+        sys.exit(0)
+
+    cols, rows = _set_size(args.size)
+    runs = _animations()
+    names = args.names or sorted(runs)
+    unknown = [n for n in names if n not in runs]
+    if unknown:
+        parser.error(f"unknown animation(s) {', '.join(unknown)}, pick from {', '.join(sorted(runs))}")
+
+    if args.command == "record":
+        with CastSink(args.path, cols, rows, realtime=args.realtime, title=", ".join(names)) as cast, using(cast):
+            for name in names:
+                runs[name]()
+        print(f"Recorded {', '.join(names)} to {args.path}")
+    else:
+        print(f"{'animation':<28} {'frames':>7} {'bytes':>10} {'B/frame':>8} {'cpu ms':>8} {'ms/frame':>9} {'length s':>9}")
+        for name in names:
+            r = bench(name, runs[name])
+            per = r.frames or 1
+            print(f"{r.name:<28} {r.frames:>7} {r.bytes:>10} {r.bytes // per:>8} {r.cpu * 1000:>8.1f} {r.cpu * 1000 / per:>9.3f} {r.seconds:>9.2f}")
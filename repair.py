@@ -1,6 +1,60 @@
+"""
+Save file repair, one file at a prompt or whole directory trees at once.
+
+Run with no arguments to be asked for a single save, or give files and
+directories to repair every save found under them:
+
+    python3 repair.py saves/ --dry-run --report fixes.jsonl --workers 8
+
+Files are repaired in parallel across a process pool, only a bounded number
+of them are in flight at a time, and one JSON line per file is written to
+the report as soon as that file is done. Saves that are already valid are
+never rewritten, and --dry-run reports what would be fixed without
+touching anything.
+"""
+
+import argparse
 import json
 import os
 import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import content
+import saves
+import schema
+
+# Report statuses
+VALID = "valid"
+REPAIRED = "repaired"
+WOULD_REPAIR = "would_repair"
+SKIPPED = "skipped"
+ERROR = "error"
+
+# Content files (data/*.json) carry a "version" too, so it doesn't mark a save
+SAVE_KEYS = schema.SCHEMA.keys() - {"version"}
+
+def _read(file_name):
+    """(state, binary) for the save at `file_name`, journal replayed."""
+    with open(file_name, 'rb') as f:
+        binary = saves.is_binary(f.read(len(saves.MAGIC)))
+    # Either format, with any autosave journal replayed, migrated by _fix. Read
+    # only, a dry run or an already valid save must not even trim a torn journal
+    return saves.load(file_name, migrate=False, read_only=True), binary
+
+def _write(file_name, fixed, binary):
+    # Written back in the format it was read in, the journal is folded in
+    data = saves.encode_binary(fixed) if binary else json.dumps(fixed, indent=4).encode()
+    saves.write_snapshot(file_name, data)
+
+def _fix(game_state):
+    # --- Same migrations, rules and defaults as the game's loader ---
+    fixed, fixes = schema.repair(game_state)
+
+    # --- Upgraded saves are written back at the current version ---
+    version = game_state.get("version", 0) if isinstance(game_state, dict) else schema.SCHEMA_VERSION
+    if version != schema.SCHEMA_VERSION:
+        fixes.insert(0, schema.Problem("version", f"migrated from {version} to {schema.SCHEMA_VERSION}"))
+    return fixed, fixes
 
 def repair_save(file_name):
     if not os.path.exists(file_name):
@@ -8,119 +62,123 @@ def repair_save(file_name):
         return
 
     try:
-        with open(file_name, 'r') as f:
-            game_state = json.load(f)
+        game_state, binary = _read(file_name)
+        fixed, fixes = _fix(game_state)
     except Exception as e:
         print(f"[ERROR] Could not read {file_name}: {e}")
         return
 
-    # --- Validation rules with defaults ---
-    required_keys = {
-        "level": (int, 1),
-        "hp": (int, 100),
-        "max_hp": (int, 100),
-        "gold": (int, 0),
-        "inventory": (list, []),
-        "weapons": (list, [["Fists", 5, 15]]),
-        "equipped": (int, 0),
-        "artifacts": (list, []),
-        "cheat_mode": (bool, False),
-        "xp": (int, 0),
-        "skill_set": (dict, {
-            "strength": 0,
-            "agility": 0,
-            "luck": 0,
-            "accuracy": 0,
-            "defence": 0
-        }),
-        "used_items": (list, []),
-        "autosave": (dict, {
-            "filename": "autosave.json",
-            "enabled": False
-        })
-    }
-
-    fixed = {}
-    fixes = []  # summary log
-
-    def log_fix(msg):
-        print(f"[FIX] {msg}")
-        fixes.append(msg)
-
-    # --- Required keys ---
-    for key, (expected_type, default_val) in required_keys.items():
-        if key not in game_state:
-            log_fix(f"Missing '{key}' → set to default {default_val}")
-            fixed[key] = default_val
-            continue
-
-        if not isinstance(game_state[key], expected_type):
-            log_fix(f"'{key}' wrong type → reset to default {default_val}")
-            fixed[key] = default_val
-            continue
+    for key, message in fixes:
+        print(f"[FIX] {key or 'save'}: {message}")
 
-        fixed[key] = game_state[key]
-
-    # --- Weapons check ---
-    valid_weapons = []
-    for weapon in fixed["weapons"]:
-        if (isinstance(weapon, list) and len(weapon) == 3 and
-            isinstance(weapon[0], str) and
-            isinstance(weapon[1], int) and weapon[1] > 0 and
-            isinstance(weapon[2], int) and weapon[2] > weapon[1]):
-            valid_weapons.append(weapon)
-        else:
-            log_fix(f"Invalid weapon {weapon} → removed")
-    if not valid_weapons:
-        log_fix("Weapons empty/invalid → set to default [['Fists', 5, 15]]")
-    fixed["weapons"] = valid_weapons or [["Fists", 5, 15]]
-
-    # --- Skill set check ---
-    if isinstance(fixed["skill_set"], dict):
-        for skill in ["strength", "agility", "luck", "accuracy", "defence"]:
-            if skill not in fixed["skill_set"] or not isinstance(fixed["skill_set"][skill], int) or fixed["skill_set"][skill] < 0:
-                log_fix(f"Invalid skill '{skill}' → set to 0")
-                fixed["skill_set"][skill] = 0
-    else:
-        log_fix("Entire skill_set invalid → reset to defaults")
-        fixed["skill_set"] = {
-            "strength": 0,
-            "agility": 0,
-            "luck": 0,
-            "accuracy": 0,
-            "defence": 0
-        }
-
-    # --- Artifacts & used_items ---
-    bad_artifacts = [a for a in fixed["artifacts"] if not isinstance(a, str)]
-    if bad_artifacts:
-        log_fix(f"Invalid artifacts removed: {bad_artifacts}")
-    fixed["artifacts"] = [a for a in fixed["artifacts"] if isinstance(a, str)]
-
-    bad_used = [a for a in fixed["used_items"] if not isinstance(a, str)]
-    if bad_used:
-        log_fix(f"Invalid used_items removed: {bad_used}")
-    fixed["used_items"] = [a for a in fixed["used_items"] if isinstance(a, str)]
-
-    # --- Autosave check ---
-    if not isinstance(fixed["autosave"], dict):
-        log_fix("Autosave invalid → reset to defaults")
-        fixed["autosave"] = {"filename": "autosave.json", "enabled": False}
-    else:
-        if not isinstance(fixed["autosave"].get("filename"), str):
-            log_fix("Autosave filename invalid → reset to 'autosave.json'")
-            fixed["autosave"]["filename"] = "autosave.json"
-        if not isinstance(fixed["autosave"].get("enabled"), bool):
-            log_fix("Autosave enabled flag invalid → reset to False")
-            fixed["autosave"]["enabled"] = False
+    if not fixes:
+        print("\nNo fixes needed. File was already valid.")
+        return fixes
 
     # --- Overwrite repaired ---
-    with open(file_name, 'w') as f:
-        json.dump(fixed, f, indent=4)
+    _write(file_name, fixed, binary)
     print(f"[DONE] Repaired file written to {file_name}")
-
-    if not fixes:
-        print("\nNo fixes needed. File was already valid.")
+    return fixes
+
+# ----------------------
+# Batch mode
+# ----------------------
+def _is_content_dir(path):
+    return os.path.isdir(content.DATA_DIR) and os.path.samefile(path, content.DATA_DIR)
+
+def find_saves(paths):
+    """Yield every save file under `paths` (files are yielded as given), lazily.
+
+    Hidden directories and the game's data/ directory are not searched.
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = [d for d in dirs if not d.startswith(".") and not _is_content_dir(os.path.join(root, d))]
+            for name in sorted(files):
+                if name.endswith((".json", saves.BINARY_EXT)):
+                    yield os.path.join(root, name)
+
+def repair_file(file_name, dry_run=False):
+    """Repair one save quietly and return its report entry.
+
+    {"file", "status", "fixes": [[key, message], ...]}, plus "error" when
+    the file could not be read or written. JSON files that are not saves
+    (not an object, or sharing no key with the schema but "version") are
+    skipped. A damaged save missing some keys is repaired like any other.
+    """
+    report = {"file": file_name, "status": VALID, "fixes": []}
+    try:
+        game_state, binary = _read(file_name)
+        if not binary and (not isinstance(game_state, dict) or SAVE_KEYS.isdisjoint(game_state)):
+            report["status"] = SKIPPED
+            return report
+        fixed, fixes = _fix(game_state)
+        report["fixes"] = [list(fix) for fix in fixes]
+        if fixes:
+            report["status"] = WOULD_REPAIR if dry_run else REPAIRED
+            if not dry_run:
+                _write(file_name, fixed, binary)
+    except Exception as e:
+        report["status"] = ERROR
+        report["error"] = f"{type(e).__name__}: {e}"
+    return report
+
+def repair_tree(paths, dry_run=False, workers=None, in_flight=None):
+    """Yield a report entry for every save under `paths`, in completion order.
+
+    Files are handed to a pool of `workers` processes, at most `in_flight`
+    at a time, so neither the file list nor the saves are ever all in memory.
+    """
+    workers = workers or os.cpu_count() or 1
+    in_flight = in_flight or workers * 4
+    files = find_saves(paths)
+    with ProcessPoolExecutor(workers) as pool:
+        pending = set()
+        for file_name in files:
+            pending.add(pool.submit(repair_file, file_name, dry_run))
+            if len(pending) >= in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in pending:
+            yield future.result()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Repair RPG save files")
+    parser.add_argument("paths", nargs="*", help="save files or directories to search, prompts for one file when empty")
+    parser.add_argument("--dry-run", action="store_true", help="report fixes without writing anything")
+    parser.add_argument("--workers", type=int, help="worker processes, defaults to the CPU count")
+    parser.add_argument("--report", help="write one JSON line per file here, - for stdout")
+    args = parser.parse_args(argv)
+
+    if not args.paths:
+        repair_save(input("Enter the path to the save file (on file, ctr+shift+c to copy path) >>> "))
+        return 0
+
+    report = None
+    if args.report == "-":
+        report = sys.stdout
+    elif args.report:
+        report = open(args.report, "w")
+
+    totals = dict.fromkeys((VALID, REPAIRED, WOULD_REPAIR, SKIPPED, ERROR), 0)
+    try:
+        for entry in repair_tree(args.paths, args.dry_run, args.workers):
+            totals[entry["status"]] += 1
+            if report:
+                report.write(json.dumps(entry) + "\n")
+                report.flush()
+            if entry["status"] == ERROR:
+                print(f"[ERROR] {entry['file']}: {entry['error']}", file=sys.stderr)
+    finally:
+        if report and report is not sys.stdout:
+            report.close()
+
+    print(", ".join(f"{n} {status}" for status, n in totals.items()), file=sys.stderr)
+    return 1 if totals[ERROR] else 0
 
 if __name__ == "__main__":
-    repair_save(input("Enter the path to the save file (on file, ctr+shift+c to copy path) >>> "))
+    sys.exit(main())
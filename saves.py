@@ -0,0 +1,492 @@
+"""
+Save file reading and writing for the game.
+
+A save is a snapshot (the usual JSON file) plus an append-only journal next
+to it (<save>.journal). After each command the autosave appends one small
+record holding only the top-level keys that changed, and every
+COMPACT_EVERY records, or on quit, the full snapshot is rewritten and the
+journal emptied. load() replays the journal over the snapshot.
+
+Journal records are one line each, "<crc32 hex> <json>\\n". A record cut
+short by a crash fails its checksum and is dropped along with anything after
+it, so a save always recovers to the last completed command. Records set
+whole key values, so replaying a journal over a snapshot that already
+includes it changes nothing.
+
+Snapshots are written to a temp file and renamed over the target, so a crash
+mid-write leaves the previous one intact. All autosave serializing and
+writing happens on a background thread, so the command loop never waits on
+the disk.
+"""
+
+import functools
+import itertools
+import json
+import operator
+import os
+import queue
+import struct
+import sys
+import tempfile
+import threading
+import zlib
+
+import schema
+
+# Journal records between full snapshots
+COMPACT_EVERY = 50
+
+# Saves with this extension use the binary format, anything else is JSON
+BINARY_EXT = ".sav"
+
+def dumps(game) -> bytes:
+    return json.dumps(game).encode()
+
+def write_atomic(path, data: bytes):
+    """Replace `path` with `data` in one step: temp file in the same directory, fsync, rename."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".save-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+def autosave_path(game):
+    """The autosave file for `game`, None when autosave is off or has no filename."""
+    autosave = game["autosave"]
+    name = autosave.get("filename")
+    if not autosave.get("enabled") or not isinstance(name, str) or not name:
+        return None
+    return name if name.endswith((".json", BINARY_EXT)) else name + ".json"
+
+# ----------------------
+# Binary format
+# ----------------------
+# Header: magic, format version, flags, crc32 of the body.
+# Body:   one fixed-size layout record (sizes, counts, the two bools), the
+#         string table (every name in section order, then the autosave
+#         filename), one packed block of 64 bit integers and float skills,
+#         then any keys outside the layout as JSON and the digits of integers
+#         too big for 64 bits.
+#
+# Names are stored in order rather than interned behind index arrays and the
+# block's Struct is cached per shape, so a save encodes in a handful of C
+# calls and decodes by slicing. A save that doesn't have the usual shape
+# (wrong types, missing keys) is kept whole in the JSON part instead.
+MAGIC = b"DRPG"
+BINARY_VERSION = 2
+HEADER = struct.Struct("<4sHHI")
+# names, table bytes, extras bytes, big bytes, cheat_mode, autosave on, autosave name (-1 for None),
+# the counts: int skills, float skills, inventory, weapons, spells, artifacts, used_items,
+# then the mask of which skills, by position in skill_set, are floats
+LAYOUT = struct.Struct("<4I??i7IQ")
+
+# Flags
+F_PACKED = 1        # the layout below is present, otherwise the whole save is the JSON part
+
+# Keys held by the layout, the integer stats first in the packed block
+SCALAR_KEYS = ("version", "level", "hp", "max_hp", "gold", "xp", "equipped")
+PACKED_KEYS = SCALAR_KEYS + ("cheat_mode", "autosave", "skill_set", "inventory", "weapons", "spells", "artifacts", "used_items")
+
+# Every integer is 64 bit. Anything bigger (the Pen, skills doubled by
+# Infinity Buff) is stored as this sentinel plus a decimal string at the end of the file
+BIG = -(1 << 63)
+_INT_MAX = (1 << 63) - 1
+
+_layout_keys = operator.itemgetter(*PACKED_KEYS)
+
+_INT = {int}
+_BOOL = {bool}
+_TRIPLE = {3}
+_NAME = (str, type(None))
+
+class SaveFormatError(ValueError):
+    pass
+
+@functools.lru_cache(maxsize=256)
+def _shape(n_skills, n_floats, n_inv, n_weapons, n_spells, n_artifacts, n_used):
+    """The packed block's Struct and slices locating each section in the names
+    and the unpacked values, worked out once per shape of save.
+
+    The block is the integer stats and skills, the float skills, then
+    inventory counts and weapon / spell lows and highs.
+    """
+    head = len(SCALAR_KEYS) + n_skills
+    block = struct.Struct(f"<{head}q{n_floats}d{n_inv + 2 * (n_weapons + n_spells)}q")
+    name_ends = list(itertools.accumulate((n_skills + n_floats, n_inv, n_weapons, n_spells, n_artifacts, n_used)))
+    names = [slice(start, end) for start, end in zip([0] + name_ends, name_ends)]
+    value_ends = list(itertools.accumulate((len(SCALAR_KEYS), n_skills + n_floats, n_inv, n_weapons, n_weapons, n_spells, n_spells)))
+    values = [slice(start, end) for start, end in zip([0] + value_ends, value_ends)][1:]
+    return (block, *names, *values)
+
+def _pack(game):
+    """The binary save for a game of the usual shape, TypeError / KeyError / ... when it isn't one."""
+    *stats, cheat_mode, autosave, skills, inventory, weapons, spells, artifacts, used = _layout_keys(game)
+    enabled, filename = autosave["enabled"], autosave["filename"]
+    rows = weapons + spells
+    if ({type(cheat_mode), type(enabled)} != _BOOL or len(autosave) != 2 or not isinstance(filename, _NAME)
+            or type(artifacts) is not list or type(used) is not list
+            or rows and set(map(len, rows)) != _TRIPLE):
+        raise TypeError("not the usual save layout")
+
+    skill_values = list(skills.values())
+    floats = ()
+    float_mask = 0
+    if set(map(type, skill_values)) - _INT:
+        # Fractional skills (the Wooden Shield) go to the float part, the mask
+        # puts them back in their place so skill_set keeps its order
+        floats = [v for v in skill_values if type(v) is float]
+        skill_values = [v for v in skill_values if type(v) is not float]
+        for i, v in enumerate(skills.values()):
+            if type(v) is float:
+                float_mask |= 1 << i
+        if float_mask >> 64:
+            raise TypeError("too many skills for the float mask")
+    w_names, w_low, w_high = zip(*weapons) if weapons else ((), (), ())
+    s_names, s_low, s_high = zip(*spells) if spells else ((), (), ())
+    head = stats + skill_values
+    tail = [*inventory.values(), *w_low, *w_high, *s_low, *s_high]
+    # Checked here since struct would take a bool as 0 or 1
+    if {*map(type, head), *map(type, tail)} != _INT:
+        raise TypeError("not the usual save layout")
+
+    names = [*skills, *inventory, *w_names, *s_names, *artifacts, *used]
+    name_at = -1
+    if filename is not None:
+        name_at = len(names)
+        names.append(filename)
+    # Raises TypeError on a name that isn't a string
+    table = "\0".join(names)
+    if table.count("\0") != len(names) - 1 and names:
+        raise TypeError("names can't hold a NUL")
+    table = table.encode()
+
+    counts = (len(skill_values), len(floats), len(inventory), len(weapons), len(spells), len(artifacts), len(used))
+    shape = _shape(*counts)[0]
+    big = b""
+    fits = BIG not in head and BIG not in tail
+    if fits:
+        try:
+            block = shape.pack(*head, *floats, *tail)
+        except struct.error:
+            fits = False
+    if not fits:
+        big = ",".join(str(v) for v in head + tail if not BIG < v <= _INT_MAX).encode()
+        head, tail = ([v if BIG < v <= _INT_MAX else BIG for v in part] for part in (head, tail))
+        block = shape.pack(*head, *floats, *tail)
+
+    # Every layout key was read above, so anything more is an extra
+    extra = b""
+    if len(game) > len(PACKED_KEYS):
+        extra = json.dumps({k: v for k, v in game.items() if k not in PACKED_KEYS}).encode()
+    body = b"".join((LAYOUT.pack(len(names), len(table), len(extra), len(big), cheat_mode, enabled, name_at, *counts, float_mask),
+                     table, block, extra, big))
+    return HEADER.pack(MAGIC, BINARY_VERSION, F_PACKED, zlib.crc32(body)) + body
+
+def encode_binary(game) -> bytes:
+    try:
+        return _pack(game)
+    except (KeyError, TypeError, AttributeError, ValueError, UnicodeEncodeError):
+        pass
+    # Not the usual shape, kept whole as JSON
+    extra = json.dumps(game).encode()
+    body = LAYOUT.pack(0, 0, len(extra), 0, False, False, -1, 0, 0, 0, 0, 0, 0, 0, 0) + extra
+    return HEADER.pack(MAGIC, BINARY_VERSION, 0, zlib.crc32(body)) + body
+
+def decode_binary(data: bytes):
+    try:
+        magic, version, flags, crc = HEADER.unpack_from(data)
+    except struct.error:
+        raise SaveFormatError("binary save is truncated") from None
+    if magic != MAGIC:
+        raise SaveFormatError("not a binary save")
+    if zlib.crc32(data[HEADER.size:]) != crc:
+        raise SaveFormatError("binary save checksum mismatch, the file is corrupt")
+    if version != BINARY_VERSION or flags & ~F_PACKED:
+        raise SaveFormatError(f"binary save is malformed: unknown version {version} / flags {flags:#x}")
+
+    try:
+        layout = LAYOUT.unpack_from(data, HEADER.size)
+        count, size, extra_size, big_size, cheat_mode, enabled, filename = layout[:7]
+        pos = HEADER.size + LAYOUT.size
+        if not flags & F_PACKED:
+            return json.loads(data[pos:pos + extra_size])
+
+        names = data[pos:pos + size].decode().split("\0") if count else []
+        if len(names) != count:
+            raise SaveFormatError("binary save string table is corrupt")
+        pos += size
+        (block, skill_names, inv_names, weapon_names, spell_names, artifacts, used,
+         skill_values, inv_counts, weapon_low, weapon_high, spell_low, spell_high) = _shape(*layout[7:14])
+        values = block.unpack_from(data, pos)
+        pos += block.size
+        if big_size:
+            digits = iter(data[pos + extra_size:pos + extra_size + big_size].decode().split(","))
+            values = [int(next(digits)) if v == BIG and type(v) is int else v for v in values]
+        skills = values[skill_values]
+        float_mask = layout[14]
+        if float_mask:
+            # Integer skills then float skills, back in skill_set order
+            n_ints = layout[7]
+            ints, floats = iter(skills[:n_ints]), iter(skills[n_ints:])
+            skills = [next(floats) if float_mask >> i & 1 else next(ints) for i in range(len(skills))]
+
+        # Same order as PACKED_KEYS
+        game = dict(zip(PACKED_KEYS, (
+            *values[:len(SCALAR_KEYS)],
+            cheat_mode,
+            {"filename": None if filename < 0 else names[filename], "enabled": enabled},
+            dict(zip(names[skill_names], skills)),
+            dict(zip(names[inv_names], values[inv_counts])),
+            [[name, low, high] for name, low, high in zip(names[weapon_names], values[weapon_low], values[weapon_high])],
+            [[name, low, high] for name, low, high in zip(names[spell_names], values[spell_low], values[spell_high])],
+            names[artifacts],
+            names[used],
+        )))
+        if extra_size:
+            game.update(json.loads(data[pos:pos + extra_size]))
+    except (struct.error, UnicodeDecodeError, IndexError, StopIteration, json.JSONDecodeError) as e:
+        raise SaveFormatError(f"binary save is malformed: {e!r}") from None
+    return game
+
+def is_binary(data: bytes):
+    return data[:len(MAGIC)] == MAGIC
+
+def encode(game, path) -> bytes:
+    """Serialized save for `path`, binary for .sav files and JSON otherwise."""
+    return encode_binary(game) if path.endswith(BINARY_EXT) else dumps(game)
+
+def decode(data: bytes):
+    """Game state from save bytes in either format."""
+    return decode_binary(data) if is_binary(data) else json.loads(data)
+
+def convert(src, dst):
+    """Rewrite the save at `src` (either format, journal included) as `dst`, format picked by extension.
+
+    `src` itself is left untouched.
+    """
+    write_snapshot(dst, encode(load(src, read_only=True), dst))
+
+# ----------------------
+# Journal
+# ----------------------
+def journal_path(path):
+    return path + ".journal"
+
+def encode_record(payload: bytes) -> bytes:
+    return b"%08x %s\n" % (zlib.crc32(payload), payload)
+
+def read_journal(path, read_only=False):
+    """Every complete record in the journal at `path`, as dicts.
+
+    A torn or corrupt record ends the journal: it and anything after it are
+    cut off the file so new records are appended after the last good one,
+    unless `read_only`.
+    """
+    records = []
+    if not os.path.exists(path):
+        return records
+    good = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n") or line[8:9] != b" ":
+                break
+            payload = line[9:-1]
+            try:
+                if int(line[:8], 16) != zlib.crc32(payload):
+                    break
+                records.append(json.loads(payload))
+            except ValueError:
+                break
+            good += len(line)
+    if not read_only and good != os.path.getsize(path):
+        with open(path, "r+b") as f:
+            f.truncate(good)
+    return records
+
+def apply_record(state, record):
+    state.update(record.get("set", {}))
+    for key in record.get("del", ()):
+        state.pop(key, None)
+    return state
+
+def write_snapshot(path, data: bytes):
+    """Write a full save to `path` and empty its journal."""
+    write_atomic(path, data)
+    if os.path.exists(journal_path(path)):
+        os.remove(journal_path(path))
+
+def load(path, migrate=True, read_only=False):
+    """The game state saved at `path`, JSON or binary: its snapshot with the journal replayed on top.
+
+    Older saves are upgraded to the current schema version unless `migrate`
+    is False. With `read_only` a torn journal is skipped past rather than
+    cut short, so the files are never changed.
+    """
+    with open(path, "rb") as f:
+        state = decode(f.read())
+    for record in read_journal(journal_path(path), read_only):
+        apply_record(state, record)
+    return schema.migrate(state) if migrate else state
+
+# ----------------------
+# Background writer
+# ----------------------
+def snapshot(value):
+    """Private copy of JSON-like game data for another thread to serialize.
+
+    Much cheaper than copy.deepcopy since it only has to know about dicts
+    (the Inventory included) and lists, everything else is an immutable scalar.
+    """
+    if isinstance(value, dict):
+        return {k: snapshot(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [snapshot(v) for v in value]
+    return value
+
+class SaveWriter(threading.Thread):
+    """Daemon thread that journals or snapshots the states handed to submit().
+
+    The queue holds a single state and a newer one replaces whatever is still
+    waiting, so a slow disk only ever delays the newest state. Each state is
+    diffed key by key against the last one written: unchanged states are
+    skipped, changed ones become one journal record, and every
+    `compact_every` records (or when asked) the full snapshot is rewritten.
+    """
+    def __init__(self, compact_every=COMPACT_EVERY):
+        super().__init__(name="save-writer", daemon=True)
+        self.compact_every = compact_every
+        self.records = 0
+        self.snapshots = 0
+        self.skipped = 0
+        self.error = None
+        self._queue = queue.Queue(maxsize=1)
+        self._path = None
+        self._parts = None        # key -> serialized value, as last written
+        self._pending = 0         # journal records since the last snapshot
+
+    def submit(self, path, state, compact=False):
+        item = (path, state, compact)
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                # Drop the stale state still waiting, the new one supersedes it
+                try:
+                    stale = self._queue.get_nowait()
+                    self._queue.task_done()
+                    if stale[2]:
+                        item = (path, state, True)
+                except queue.Empty:
+                    pass
+
+    def flush(self):
+        """Block until every submitted state has been written, or the thread has died."""
+        # queue.join() with a liveness check, a dead writer would never finish the queue
+        done = self._queue.all_tasks_done
+        with done:
+            while self._queue.unfinished_tasks and self.is_alive():
+                done.wait(0.1)
+
+    def close(self):
+        self.flush()
+        if self.is_alive():
+            self._queue.put(None)
+            self.join()
+
+    def run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+            except Exception as e:
+                # A full disk or a state that won't serialize, reported via
+                # .error, the thread keeps going so flush() never hangs
+                self.error = e
+                # Start over from a full snapshot with the next state
+                self._parts = None
+            finally:
+                self._queue.task_done()
+
+    def _write(self, path, state, compact):
+        parts = {key: json.dumps(value) for key, value in state.items()}
+        if path != self._path or self._parts is None:
+            compact = True
+        elif parts == self._parts and not (compact and self._pending):
+            self.skipped += 1
+            return
+
+        if compact or self._pending >= self.compact_every:
+            if path.endswith(BINARY_EXT):
+                data = encode_binary(state)
+            else:
+                data = ("{" + ", ".join(f"{json.dumps(key)}: {value}" for key, value in parts.items()) + "}").encode()
+            write_snapshot(path, data)
+            self._pending = 0
+            self.snapshots += 1
+        else:
+            changed = ", ".join(f"{json.dumps(key)}: {value}" for key, value in parts.items() if self._parts.get(key) != value)
+            removed = [key for key in self._parts if key not in parts]
+            payload = ('{"set": {' + changed + '}, "del": ' + json.dumps(removed) + "}").encode()
+            with open(journal_path(path), "ab") as f:
+                f.write(encode_record(payload))
+                f.flush()
+                os.fsync(f.fileno())
+            self._pending += 1
+            self.records += 1
+        self._path, self._parts = path, parts
+
+class Autosaver:
+    """Autosave front end for the command loop.
+
+    save() takes a snapshot and hands it to a background SaveWriter, so a
+    command never waits on the disk. flush() waits for the writer to catch up.
+    """
+    def __init__(self, compact_every=COMPACT_EVERY):
+        self.compact_every = compact_every
+        self._writer = None
+
+    def save(self, game, force=False, compact=False):
+        """Queue an autosave of `game`.
+
+        With `force`, wait until it is on disk; with `compact`, write a full
+        snapshot instead of a journal record.
+        """
+        path = autosave_path(game)
+        if path is not None:
+            if self._writer is None:
+                self._writer = SaveWriter(self.compact_every)
+                self._writer.start()
+            self._writer.submit(path, snapshot(game), compact)
+        if force or compact:
+            self.flush()
+
+    def flush(self):
+        if self._writer is not None:
+            self._writer.flush()
+
+    def take_error(self):
+        """The last write error since this was called, or None."""
+        if self._writer is None:
+            return None
+        error, self._writer.error = self._writer.error, None
+        return error
+
+if __name__ == "__main__":
+    # python3 saves.py old.json new.sav (or the other way round)
+    if len(sys.argv) != 3:
+        print("Usage: python3 saves.py <source save> <destination save>")
+        sys.exit(1)
+    convert(sys.argv[1], sys.argv[2])
+    print(f"Converted {sys.argv[1]} to {sys.argv[2]}")
@@ -0,0 +1,244 @@
+"""
+The save file schema, shared by rpg.json_load and repair.py.
+
+SCHEMA declares every key of a save once: the types it may have, its default
+and the rule each entry of a list or dict must follow. It is compiled at
+import into one small check function per key, so validate() is a flat loop
+of closures and runs in a few microseconds on a normal save.
+
+Saves carry a "version". migrate() brings an older save up to SCHEMA_VERSION
+by running the steps in MIGRATIONS one after another, and returns a current
+save untouched after a single version check. It runs at load time, before
+validation.
+
+validate() only reports. repair() returns a fixed copy built from the same
+rules: missing or mistyped keys get their default, and bad entries are dropped.
+Both return a list of Problem tuples instead of printing, so the game, the
+repair tool and batch tooling can each present them their own way.
+"""
+
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+SKILLS = ("strength", "agility", "luck", "accuracy", "defence")
+
+# Bump with every new step in MIGRATIONS, saves without a version are version 0
+SCHEMA_VERSION = 2
+
+class MigrationError(ValueError):
+    pass
+
+class Problem(NamedTuple):
+    key: str        # top-level save key, "" for the save as a whole
+    message: str
+
+class Rule(NamedTuple):
+    types: Tuple[type, ...]             # accepted types for the value
+    default: Callable                   # factory for a fresh default value
+    entry: Callable = None              # entry(item) -> True if a list entry / (key, value) pair is fine
+    complete: Tuple = ()                # dict keys that must all be present, filled from the default
+    non_empty: bool = False             # an empty list / dict is replaced by the default
+    required: bool = True               # False for keys older saves may not have
+
+# ----------------------
+# Entry rules
+# ----------------------
+def _is_int(v):
+    return isinstance(v, int) and not isinstance(v, bool)
+
+def _is_number(v):
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+def _weapon(w):
+    return (isinstance(w, list) and len(w) == 3 and isinstance(w[0], str)
+            and _is_int(w[1]) and _is_int(w[2]) and 0 < w[1] < w[2])
+
+def _spell(s):
+    return (isinstance(s, list) and len(s) == 3 and isinstance(s[0], str)
+            and _is_int(s[1]) and _is_int(s[2]) and 0 <= s[1] <= s[2])
+
+def _name(a):
+    return isinstance(a, str)
+
+def _inventory_entry(pair):
+    return isinstance(pair[0], str) and _is_int(pair[1]) and pair[1] > 0
+
+def _skill(pair):
+    return pair[0] in SKILLS and _is_number(pair[1]) and pair[1] >= 0
+
+def _autosave(pair):
+    key, value = pair
+    if key == "enabled":
+        return isinstance(value, bool)
+    if key == "filename":
+        return value is None or isinstance(value, str)
+    return False
+
+# ----------------------
+# Schema
+# ----------------------
+SCHEMA: Dict[str, Rule] = {
+    "version": Rule((int,), lambda: SCHEMA_VERSION),
+    "level": Rule((int,), lambda: 1),
+    "hp": Rule((int,), lambda: 100),
+    "max_hp": Rule((int,), lambda: 100),
+    "gold": Rule((int,), lambda: 0),
+    "inventory": Rule((dict,), dict, _inventory_entry),
+    "weapons": Rule((list,), lambda: [["Fists", 5, 15]], _weapon, non_empty=True),
+    "equipped": Rule((int,), lambda: 0),
+    "artifacts": Rule((list,), list, _name),
+    "cheat_mode": Rule((bool,), lambda: False),
+    "xp": Rule((int,), lambda: 0),
+    "skill_set": Rule((dict,), lambda: dict.fromkeys(SKILLS, 0), _skill, SKILLS),
+    "used_items": Rule((list,), list, _name),
+    "autosave": Rule((dict,), lambda: {"filename": None, "enabled": False}, _autosave, ("filename", "enabled")),
+    "spells": Rule((list,), list, _spell),
+}
+
+def default_game():
+    """A fresh save with every key at its default."""
+    return {key: rule.default() for key, rule in SCHEMA.items()}
+
+# ----------------------
+# Migrations
+# ----------------------
+def _inventory_counts(state):
+    """1: the inventory is {item: count} instead of one list entry per unit."""
+    inventory = state.get("inventory")
+    if isinstance(inventory, list) and all(isinstance(item, str) for item in inventory):
+        counts = {}
+        for item in inventory:
+            counts[item] = counts.get(item, 0) + 1
+        state["inventory"] = counts
+
+def _add_spells(state):
+    """2: every save has the spells list the Beginner's Scroll adds to."""
+    state.setdefault("spells", [])
+
+# version -> step that upgrades a save from that version to the next one
+MIGRATIONS: Dict[int, Callable] = {
+    0: _inventory_counts,
+    1: _add_spells,
+}
+
+def migrate(state):
+    """Upgrade `state` in place to SCHEMA_VERSION and return it.
+
+    Raises MigrationError for a save written by a newer version of the game.
+    Anything that is not a save object is returned as it is for validate()
+    to report.
+    """
+    if not isinstance(state, dict):
+        return state
+    version = state.get("version", 0)
+    if version == SCHEMA_VERSION:
+        return state
+    if not _is_int(version) or not 0 <= version < SCHEMA_VERSION:
+        raise MigrationError(f"unsupported save version {version!r}, this game reads up to {SCHEMA_VERSION}")
+    while version < SCHEMA_VERSION:
+        MIGRATIONS[version](state)
+        version += 1
+    state["version"] = version
+    return state
+
+# ----------------------
+# Compiled checks
+# ----------------------
+def _entries(value):
+    return value.items() if isinstance(value, dict) else value
+
+def _compile(key, rule):
+    types = rule.types
+    entry = rule.entry
+    complete = rule.complete
+    non_empty = rule.non_empty
+    # bool is an int subclass, but True is never a valid level or gold amount
+    reject_bool = bool not in types
+
+    def check(value):
+        if not isinstance(value, types) or (reject_bool and isinstance(value, bool)):
+            return f"expected {' or '.join(t.__name__ for t in types)}, got {type(value).__name__}"
+        if entry is not None:
+            for item in _entries(value):
+                if not entry(item):
+                    return f"invalid entry {item!r}"
+        for k in complete:
+            if k not in value:
+                return f"missing {k!r}"
+        if non_empty and not value:
+            return "must not be empty"
+        return None
+    return check
+
+_CHECKS = [(key, rule, _compile(key, rule)) for key, rule in SCHEMA.items()]
+
+def validate(state) -> List[Problem]:
+    """Every way `state` breaks the schema, empty when it is a valid save."""
+    if not isinstance(state, dict):
+        return [Problem("", f"save must be an object, got {type(state).__name__}")]
+    problems = []
+    for key, rule, check in _CHECKS:
+        if key not in state:
+            if rule.required:
+                problems.append(Problem(key, "missing"))
+            continue
+        message = check(state[key])
+        if message:
+            problems.append(Problem(key, message))
+    if problems:
+        return problems
+    if state["version"] != SCHEMA_VERSION:
+        problems.append(Problem("version", f"is {state['version']}, expected {SCHEMA_VERSION}"))
+    if not 0 <= state["equipped"] < len(state["weapons"]):
+        problems.append(Problem("equipped", f"no weapon {state['equipped']}"))
+    return problems
+
+def repair(state) -> Tuple[dict, List[Problem]]:
+    """A schema-valid copy of `state` and a Problem for every fix that was needed.
+
+    The save is migrated first (MigrationError if it is from a newer game),
+    unknown keys are kept as they are.
+    """
+    if not isinstance(state, dict):
+        return default_game(), [Problem("", "not a save object, replaced with a new game")]
+    state = migrate(dict(state))
+    fixed = dict(state)
+    fixes = []
+    for key, rule, check in _CHECKS:
+        if key not in state:
+            if rule.required:
+                fixed[key] = rule.default()
+                fixes.append(Problem(key, f"missing, set to default {fixed[key]!r}"))
+            continue
+        value = state[key]
+        if check(value) is None:
+            continue
+        if not isinstance(value, rule.types) or (bool not in rule.types and isinstance(value, bool)):
+            fixed[key] = rule.default()
+            fixes.append(Problem(key, f"wrong type, reset to default {fixed[key]!r}"))
+            continue
+
+        # Right container, some entries are bad: drop them and fill in what's required
+        if isinstance(value, dict):
+            kept = {k: v for k, v in value.items() if rule.entry is None or rule.entry((k, v))}
+            bad = [k for k in value if k not in kept]
+        else:
+            kept = [v for v in value if rule.entry is None or rule.entry(v)]
+            bad = [v for v in value if not (rule.entry is None or rule.entry(v))]
+        if bad:
+            fixes.append(Problem(key, f"invalid entries removed: {bad!r}"))
+        if rule.complete:
+            default = rule.default()
+            for k in rule.complete:
+                if k not in kept:
+                    kept[k] = default[k]
+                    fixes.append(Problem(key, f"missing {k!r}, set to {default[k]!r}"))
+        if rule.non_empty and not kept:
+            kept = rule.default()
+            fixes.append(Problem(key, f"nothing valid left, set to default {kept!r}"))
+        fixed[key] = kept
+
+    # The equipped weapon has to exist
+    if _is_int(fixed["equipped"]) and not 0 <= fixed["equipped"] < len(fixed["weapons"]):
+        fixes.append(Problem("equipped", f"no weapon {fixed['equipped']}, reset to 0"))
+        fixed["equipped"] = 0
+    return fixed, fixes
@@ -0,0 +1,21 @@
+import json
+
+import repair
+import schema
+
+def test_repair_tree_fixes_save_missing_skill_set(tmp_path):
+    game = schema.default_game()
+    del game["skill_set"]
+    path = tmp_path / "broken.json"
+    path.write_text(json.dumps(game))
+
+    [entry] = repair.repair_tree([str(tmp_path)], workers=1)
+    assert entry["status"] == repair.REPAIRED
+    assert json.loads(path.read_text())["skill_set"] == schema.default_game()["skill_set"]
+
+def test_repair_tree_skips_non_saves(tmp_path):
+    (tmp_path / "list.json").write_text("[1, 2]")
+    (tmp_path / "spells.json").write_text(json.dumps({"version": 1, "beginners_scroll": []}))
+
+    entries = list(repair.repair_tree([str(tmp_path)], dry_run=True, workers=1))
+    assert [e["status"] for e in entries] == [repair.SKIPPED, repair.SKIPPED]
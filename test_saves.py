@@ -0,0 +1,26 @@
+import pytest
+
+import saves
+import schema
+
+def test_binary_round_trip_keeps_skill_order():
+    game = schema.default_game()
+    # The Wooden Shield leaves a fractional skill in the middle of skill_set
+    game["skill_set"]["agility"] = 0.5
+    game["skill_set"]["defence"] = 2.25
+    decoded = saves.decode_binary(saves.encode_binary(game))
+    assert list(decoded["skill_set"]) == list(game["skill_set"])
+    assert decoded == game
+
+def test_binary_round_trip_big_ints():
+    game = schema.default_game()
+    game["gold"] = 10**40
+    game["skill_set"]["luck"] = -(10**30)
+    assert saves.decode_binary(saves.encode_binary(game)) == game
+
+def test_unknown_binary_version_is_rejected():
+    data = bytearray(saves.encode_binary(schema.default_game()))
+    magic, _, flags, crc = saves.HEADER.unpack_from(data)
+    saves.HEADER.pack_into(data, 0, magic, saves.BINARY_VERSION + 1, flags, crc)
+    with pytest.raises(saves.SaveFormatError):
+        saves.decode_binary(bytes(data))